@@ -1,5 +1,6 @@
-from .response import Response
-
-
 # Default datetime input and output formats
 ISO_8601 = 'iso-8601'
+
+# Imported after ISO_8601, which the modules of the package import from
+# here while `response` is being imported.
+from .response import Response  # noqa: E402
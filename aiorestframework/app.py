@@ -1,6 +1,7 @@
 from aiohttp.web import Application
 from aiohttp.log import web_logger
 
+from .compression import CompressionStats
 from .routers import APIUrlDispatcher
 
 
@@ -12,8 +13,11 @@ __all__ = (
 class APIApplication(Application):
     def __init__(self, *, name='', logger=web_logger, router=None,
                  middlewares=(), handler_args=None, client_max_size=1024**2,
-                 loop=None, debug=...):
+                 loop=None, debug=..., compress=None):
         self.name = name
+        # Overrides the `COMPRESSION_ENABLED` setting if not None
+        self.compress = compress
+        self.compression_stats = CompressionStats()
         if router is None:
             router = APIUrlDispatcher()
         assert isinstance(router, APIUrlDispatcher), router
@@ -0,0 +1,343 @@
+"""
+In-process caches of encoded responses and permission decisions.
+
+Entries expire after a TTL and the least recently used ones are evicted
+when the cache is full. Concurrent response misses for the same key are
+coalesced, so that a single request computes the response and the others
+wait for it.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from functools import wraps
+from operator import itemgetter
+
+from aiohttp import hdrs
+
+from aiorestframework.negotiation import ACCEPTED_RENDERER_KEY
+from aiorestframework.response import Response
+from aiorestframework.settings import api_settings
+
+
+__all__ = (
+    'CacheStats', 'TTLCache', 'ResponseCache', 'PermissionCache',
+    'cache_response', 'get_cache_key', 'permission_cache'
+)
+
+
+# Methods which responses are cached.
+CACHE_METHODS = (hdrs.METH_GET, hdrs.METH_HEAD)
+
+# Headers that are set again when the cached body is sent.
+EXCLUDED_HEADERS = (
+    hdrs.CONTENT_LENGTH, hdrs.CONTENT_TYPE, hdrs.CONTENT_ENCODING
+)
+
+
+class CacheStats:
+    """
+    Counters of a `TTLCache`. Coalesced requests waited for another
+    request computing the same response, and are counted as misses too.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+    def as_dict(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hit_rate,
+        }
+
+    def clear(self):
+        self.__init__()
+
+
+class CachedResponse:
+    """
+    Encoded response stored in the cache. Every hit is answered with a new
+    `Response` built from it, since responses can be sent only once.
+    """
+    __slots__ = ('status', 'body', 'headers', 'content_type', 'charset')
+
+    def __init__(self, status, body, headers, content_type, charset):
+        self.status = status
+        self.body = body
+        self.headers = headers
+        self.content_type = content_type
+        self.charset = charset
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        Return the cached form of a rendered response, or `None` if its
+        body isn't encoded.
+        """
+        body = response.body
+        if not isinstance(body, (bytes, bytearray, memoryview)):
+            return None
+        headers = tuple(
+            (name, value) for name, value in response.headers.items()
+            if name not in EXCLUDED_HEADERS
+        )
+        return cls(response.status, bytes(body), headers,
+                   response.content_type, response.charset)
+
+    def to_response(self):
+        return Response(
+            data=self.body, status=self.status, headers=self.headers,
+            content_type=self.content_type, charset=self.charset)
+
+
+class TTLCache:
+    """
+    TTL and LRU bounded mapping. Values can't be `None`.
+    """
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return the live entry of `key`, or `None`. Stats aren't updated.
+        """
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key, entry):
+        self._entries[key] = (time.monotonic() + self.ttl, entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def discard(self, predicate=None):
+        """
+        Drop the entries which key matches `predicate`, or all of them.
+        """
+        if predicate is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+
+class ResponseCache(TTLCache):
+    """
+    Cache of `CachedResponse` by `get_cache_key()`. `ttl` and `max_size`
+    default to the `RESPONSE_CACHE_TTL` and `RESPONSE_CACHE_MAX_SIZE`
+    settings.
+    """
+
+    def __init__(self, ttl=None, max_size=None):
+        if ttl is None:
+            ttl = api_settings.RESPONSE_CACHE_TTL
+        if max_size is None:
+            max_size = api_settings.RESPONSE_CACHE_MAX_SIZE
+        super().__init__(ttl, max_size)
+        self._inflight = {}
+
+    def invalidate(self, resource_name=None):
+        """
+        Drop the entries of a resource, or all of them.
+        """
+        if resource_name is None:
+            self.discard()
+        else:
+            self.discard(lambda key: key[0] == resource_name)
+
+    async def fetch(self, key, compute):
+        """
+        Return a `(result, entry)` tuple for `key`.
+
+        On a hit, `result` is `None`. On a miss, `compute()` is awaited and
+        must return the `(result, entry)` tuple, where `entry` is `None` if
+        the result can't be shared. The entry is stored if it is a 200.
+        Requests missing the same key meanwhile wait for that computation,
+        get its entry and a `None` result, or its exception.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            self.stats.hits += 1
+            return None, entry
+        self.stats.misses += 1
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+            try:
+                return None, await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The request computing the response was cancelled.
+            return await compute()
+
+        future = asyncio.get_event_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result, entry = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved when nobody waits for it.
+            future.exception()
+            raise
+        else:
+            if entry is not None and entry.status == 200:
+                self.set(key, entry)
+            future.set_result(entry)
+        finally:
+            del self._inflight[key]
+        return result, entry
+
+
+class PermissionCache(TTLCache):
+    """
+    Cache of permission decisions, keyed by (permission class, principal
+    key, resource name, object key, HTTP method), since permissions may
+    allow a method and deny another on the same object. `ttl` and
+    `max_size` default to the `PERMISSION_CACHE_TTL` and
+    `PERMISSION_CACHE_MAX_SIZE` settings.
+    See `GenericViewSet.evaluate_permission()`.
+    """
+
+    def __init__(self, ttl=None, max_size=None):
+        if ttl is None:
+            ttl = api_settings.PERMISSION_CACHE_TTL
+        if max_size is None:
+            max_size = api_settings.PERMISSION_CACHE_MAX_SIZE
+        super().__init__(ttl, max_size)
+
+    def lookup(self, key):
+        """
+        Return the cached decision of `key`, or `None`, and count it.
+        """
+        decision = self.get(key)
+        if decision is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return decision
+
+    def invalidate(self, permission_class=None, principal=None,
+                   resource_name=None, object_key=None, method=None):
+        """
+        Drop the decisions matching all the given key parts, e.g. those of
+        a principal which roles changed, or all of them.
+        """
+        parts = [
+            (index, part) for index, part in enumerate(
+                (permission_class, principal, resource_name, object_key,
+                 method))
+            if part is not None
+        ]
+        if not parts:
+            self.discard()
+            return
+        self.discard(
+            lambda key: all(key[index] == part for index, part in parts))
+
+
+# Used by the ViewSets without own `permission_cache`.
+permission_cache = PermissionCache()
+
+
+def get_resource_name(view, request):
+    resource = getattr(request.match_info.route, 'resource', None)
+    name = getattr(resource, 'name', None)
+    if name is None:
+        name = view._get_resource_name()
+    return name
+
+
+def get_cache_key(view, request, vary_by_user=None):
+    """
+    Return the cache key of a request: the resource name, the URL match
+    info, the query string with sorted keys, the negotiated media type and
+    the user key given by `vary_by_user(request)`, if any.
+    """
+    renderer = request.get(ACCEPTED_RENDERER_KEY)
+    user = vary_by_user(request) if vary_by_user is not None else None
+    return (
+        get_resource_name(view, request),
+        tuple(sorted(request.match_info.items())),
+        tuple(sorted(request.query.items(), key=itemgetter(0))),
+        getattr(renderer, 'media_type', None),
+        user,
+    )
+
+
+def cache_response(ttl=None, max_size=None, vary_by_user=None, cache=None):
+    """
+    Cache the encoded responses of a ViewSet handler for GET and HEAD
+    requests. Other methods, and other responses than 200 ones, aren't
+    cached.
+
+    :param ttl: Seconds an entry lives, `RESPONSE_CACHE_TTL` by default.
+    :param max_size: Number of entries, `RESPONSE_CACHE_MAX_SIZE` by default.
+    :param vary_by_user: Function returning the user key of a request,
+     for responses that depend on the user.
+    :param cache: `ResponseCache` shared with other handlers.
+    :return: wrapped handler with .response_cache attribute
+    """
+    if cache is None:
+        cache = ResponseCache(ttl, max_size)
+
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(view, request):
+            if request.method not in CACHE_METHODS:
+                return await handler(view, request)
+
+            async def compute():
+                result = await handler(view, request)
+                if not isinstance(result, Response):
+                    return result, None
+                await result.render_async(
+                    request.get(ACCEPTED_RENDERER_KEY), request)
+                return result, CachedResponse.from_response(result)
+
+            key = get_cache_key(view, request, vary_by_user)
+            result, entry = await cache.fetch(key, compute)
+            if result is not None:
+                return result
+            if entry is None:
+                return await handler(view, request)
+            return entry.to_response()
+
+        wrapper.response_cache = cache
+        return wrapper
+
+    return decorator
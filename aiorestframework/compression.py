@@ -0,0 +1,234 @@
+"""
+Negotiated compression of response bodies.
+
+The content coding is picked from the request `Accept-Encoding` header,
+among gzip, deflate and brotli if it is installed. Small bodies are sent
+as is, and large ones are compressed in a thread pool so that the event
+loop doesn't stall.
+"""
+import asyncio
+import time
+import zlib
+from functools import lru_cache
+
+from aiohttp import hdrs
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from aiorestframework.settings import api_settings
+
+
+__all__ = (
+    'CompressionStats', 'select_encoding', 'compress_response'
+)
+
+
+def compress_gzip(body, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+def compress_deflate(body, level):
+    return zlib.compress(body, level)
+
+
+def compress_brotli(body, level):
+    # Brotli quality goes from 0 to 11, zlib levels from 0 to 9.
+    return brotli.compress(bytes(body), quality=min(level, 11))
+
+
+COMPRESSORS = {
+    'gzip': compress_gzip,
+    'deflate': compress_deflate,
+}
+if brotli is not None:
+    COMPRESSORS['br'] = compress_brotli
+
+
+@lru_cache(maxsize=256)
+def parse_accept_encoding(value):
+    """
+    Parse an Accept-Encoding header into a dict of {coding: quality}.
+    """
+    codings = {}
+    for part in value.split(','):
+        params = [param.strip() for param in part.split(';')]
+        coding = params[0].lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params[1:]:
+            key, _, param_value = param.partition('=')
+            if key.strip() == 'q':
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def select_encoding(accept_encoding, encodings=None):
+    """
+    Return the preferred content coding accepted by the client among
+    `encodings`, `COMPRESSION_ENCODINGS` by default, or `None`.
+    Ties are broken by the order of `encodings`.
+    """
+    if not accept_encoding:
+        return None
+    if encodings is None:
+        encodings = api_settings.COMPRESSION_ENCODINGS
+    codings = parse_accept_encoding(accept_encoding)
+    wildcard = codings.get('*', 0.0)
+
+    selected = None
+    selected_quality = 0.0
+    for encoding in encodings:
+        if encoding not in COMPRESSORS:
+            continue
+        quality = codings.get(encoding, wildcard)
+        if quality > selected_quality:
+            selected, selected_quality = encoding, quality
+    return selected
+
+
+class RouteCompressionStats:
+    """
+    Compression counters of one route.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+
+    @property
+    def ratio(self):
+        if not self.bytes_in:
+            return 1.0
+        return self.bytes_out / self.bytes_in
+
+    @property
+    def average_seconds(self):
+        if not self.count:
+            return 0.0
+        return self.seconds / self.count
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'ratio': self.ratio,
+            'seconds': self.seconds,
+            'average_seconds': self.average_seconds,
+        }
+
+
+class CompressionStats:
+    """
+    Compression ratio and time, per route. Routes are keyed by
+    "METHOD resource-name", or by the path pattern of unnamed resources,
+    such as "/users/{id}", so that the number of keys stays bounded.
+    """
+
+    def __init__(self):
+        self.routes = {}
+
+    def record(self, route, bytes_in, bytes_out, seconds):
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteCompressionStats()
+        stats.count += 1
+        stats.bytes_in += bytes_in
+        stats.bytes_out += bytes_out
+        stats.seconds += seconds
+
+    def get(self, route):
+        return self.routes.get(route)
+
+    def as_dict(self):
+        return {
+            route: stats.as_dict() for route, stats in self.routes.items()
+        }
+
+    def clear(self):
+        self.routes.clear()
+
+
+# Used for the applications that are not `APIApplication` instances.
+default_stats = CompressionStats()
+
+# Route key part of the requests that matched no resource.
+UNRESOLVED_ROUTE = '<unresolved>'
+
+
+def get_route_key(request):
+    resource = getattr(request.match_info.route, 'resource', None)
+    name = getattr(resource, 'name', None)
+    if name is None:
+        # Responses without resource, e.g. 404, share one key.
+        name = getattr(resource, 'canonical', None) or UNRESOLVED_ROUTE
+    return ' '.join((request.method, name))
+
+
+def is_compression_enabled(response, request):
+    if response.compress is not None:
+        return response.compress
+    compress = getattr(request.app, 'compress', None)
+    if compress is not None:
+        return compress
+    return api_settings.COMPRESSION_ENABLED
+
+
+async def compress_response(response, request):
+    """
+    Compress the body of `response` in place with the coding negotiated
+    for `request`, if compression is enabled and the body is large enough.
+    Bodies of at least `COMPRESSION_EXECUTOR_THRESHOLD` bytes are
+    compressed in the default executor.
+    """
+    body = response.body
+    if not is_compression_enabled(response, request):
+        return
+    if not isinstance(body, (bytes, bytearray, memoryview)):
+        return
+    if hdrs.CONTENT_ENCODING in response.headers or response.status in (204, 304):
+        return
+
+    size = len(body)
+    if size < api_settings.COMPRESSION_MIN_SIZE:
+        return
+
+    encoding = select_encoding(request.headers.get(hdrs.ACCEPT_ENCODING))
+    if encoding is None:
+        return
+
+    compressor = COMPRESSORS[encoding]
+    level = api_settings.COMPRESSION_LEVEL
+    started = time.perf_counter()
+    if size >= api_settings.COMPRESSION_EXECUTOR_THRESHOLD:
+        loop = asyncio.get_event_loop()
+        compressed = await loop.run_in_executor(None, compressor, body, level)
+    else:
+        compressed = compressor(body, level)
+    seconds = time.perf_counter() - started
+
+    response.body = compressed
+    response.headers[hdrs.CONTENT_ENCODING] = encoding
+    etag = response.headers.get(hdrs.ETAG)
+    if etag is not None and etag.endswith('"'):
+        # Strong ETags differ between content codings.
+        response.headers[hdrs.ETAG] = '%s-%s"' % (etag[:-1], encoding)
+    vary = response.headers.get(hdrs.VARY)
+    if vary is None:
+        response.headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+    elif hdrs.ACCEPT_ENCODING.lower() not in vary.lower():
+        response.headers[hdrs.VARY] = ', '.join((vary, hdrs.ACCEPT_ENCODING))
+
+    stats = getattr(request.app, 'compression_stats', default_stats)
+    stats.record(get_route_key(request), size, len(compressed), seconds)
@@ -0,0 +1,88 @@
+"""
+Strong ETags and conditional GET handling.
+
+ETags are computed from the encoded body with a fast hash, or from a
+version token supplied by the ViewSet, in which case a request from a
+client that is current is answered without running the handler.
+"""
+import hashlib
+
+from aiohttp import hdrs
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from aiorestframework.compression import COMPRESSORS
+from aiorestframework.response import Response
+
+
+__all__ = (
+    'compute_etag', 'compute_version_etag', 'etag_matches', 'not_modified'
+)
+
+
+# Methods which responses carry an ETag.
+ETAG_METHODS = (hdrs.METH_GET, hdrs.METH_HEAD)
+
+
+def hash_bytes(value):
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(value)
+    return hashlib.blake2b(value, digest_size=16).hexdigest()
+
+
+def compute_etag(body):
+    """
+    Return the strong ETag of an encoded body.
+    """
+    return '"%s"' % hash_bytes(body)
+
+
+def compute_version_etag(request, media_type, token):
+    """
+    Return the strong ETag of the representation of a resource at a given
+    version, without having to render it.
+    """
+    key = '\n'.join((request.path_qs, media_type or '', str(token)))
+    return '"%s"' % hash_bytes(key.encode('utf-8'))
+
+
+def normalize_etag(etag):
+    """
+    Strip the weak prefix and the content coding suffix, see
+    `compression.compress_response()`, of an ETag.
+    """
+    etag = etag.strip()
+    if etag.startswith('W/'):
+        etag = etag[2:]
+    etag = etag.strip('"')
+    for encoding in COMPRESSORS:
+        suffix = '-' + encoding
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)]
+    return etag
+
+
+def etag_matches(request, etag):
+    """
+    Whether the `If-None-Match` header of the request matches `etag`.
+    """
+    if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    etag = normalize_etag(etag)
+    return any(
+        normalize_etag(candidate) == etag
+        for candidate in if_none_match.split(',')
+    )
+
+
+def not_modified(etag):
+    """
+    Return an empty 304 response for `etag`.
+    """
+    return Response(status=304, headers={hdrs.ETAG: etag})
@@ -9,7 +9,8 @@ from aiorestframework import status
 __all__ = (
     'SkipField', 'APIError', 'MethodNotAllowed', 'ValidationError',
     'ParseError', 'AuthenticationFailed', 'NotAuthenticated',
-    'PermissionDenied', 'NotFound'
+    'PermissionDenied', 'NotFound', 'NotAcceptable', 'RequestEntityTooLarge',
+    'UnsupportedMediaType'
 )
 
 
@@ -25,6 +26,10 @@ class APIError(web_exceptions.HTTPError):
     default_api_code = 'error'
     default_headers = None
 
+    # Bodies of the errors raised with the default detail and api code,
+    # rendered once per (class, status code, detail, api code).
+    _default_texts = {}
+
     def __init__(self, *, detail=None, api_code=None, status_code=None,
                  headers=None):
         self.detail = self.get_detail(detail=detail)
@@ -35,9 +40,21 @@ class APIError(web_exceptions.HTTPError):
         if headers is None:
             headers = self.default_headers
 
-        message = self.get_message()
-        super().__init__(text=ujson.dumps(message), headers=headers,
-                         content_type='application/json')
+        super().__init__(text=self.get_text(detail is None and api_code is None),
+                         headers=headers, content_type='application/json')
+
+    def get_text(self, is_default=False):
+        """
+        Return the JSON encoded message, reusing the one rendered for the
+        previous errors of this class and status if `is_default`.
+        """
+        if not is_default or not isinstance(self.detail, str):
+            return ujson.dumps(self.get_message())
+        key = (self.__class__, self.status_code, self.detail, self.api_code)
+        text = self._default_texts.get(key)
+        if text is None:
+            text = self._default_texts[key] = ujson.dumps(self.get_message())
+        return text
 
     def get_detail(self, *, detail, **kwargs):
         if detail is not None:
@@ -118,4 +135,29 @@ class PermissionDenied(APIError):
 class NotFound(APIError):
     status_code = status.HTTP_404_NOT_FOUND
     default_detail = 'Not found.'
-    default_api_code = 'not_found'
\ No newline at end of file
+    default_api_code = 'not_found'
+
+
+class NotAcceptable(APIError):
+    status_code = status.HTTP_406_NOT_ACCEPTABLE
+    default_detail = 'Could not satisfy the request Accept header.'
+    default_api_code = 'not_acceptable'
+
+
+class RequestEntityTooLarge(APIError):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'Request body is too large.'
+    default_api_code = 'request_entity_too_large'
+
+
+class UnsupportedMediaType(APIError):
+    status_code = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    default_detail = 'Unsupported media type "{media_type}" in request.'
+    default_api_code = 'unsupported_media_type'
+
+    def __init__(self, media_type, detail=None, api_code=None,
+                 status_code=None, headers=None):
+        if detail is None:
+            detail = self.default_detail.format(media_type=media_type)
+        super().__init__(detail=detail, api_code=api_code,
+                         status_code=status_code, headers=headers)
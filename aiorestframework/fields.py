@@ -1,16 +1,22 @@
+import asyncio
 import collections
+import collections.abc
 import copy
 import datetime
 import decimal
 import inspect
 import json
+import operator
 import re
+import types
 import uuid
 from collections import OrderedDict
+from functools import lru_cache
 
 from aiorestframework import ISO_8601
 from aiorestframework import exceptions
 from aiorestframework import validators as val
+from aiorestframework.negotiation import ACCEPTED_RENDERER_KEY
 from aiorestframework.utils import (
     timezone, representation, html, ipv6, dateparse, humanize_datetime
 )
@@ -19,6 +25,11 @@ from aiorestframework.utils.functional import cached_property
 
 from aiorestframework.settings import api_settings
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 __all__ = (
     'empty', 'set_value', 'Field', 'BooleanField', 'NullBooleanField',
@@ -40,21 +51,93 @@ class empty:
     pass
 
 
+# Only functions and methods may be called by `get_attribute()`.
+CALLABLE_TYPES = frozenset((types.FunctionType, types.MethodType))
+
+# Results of `is_simple_callable()`, keyed by `(function, is_bound_method)`.
+_simple_callables = {}
+SIMPLE_CALLABLES_CACHE_SIZE = 4096
+
+
 def is_simple_callable(obj):
     """
     True if the object is a callable that takes no arguments.
+
+    The signature check is cached per underlying function, so bound methods
+    of different instances share one `inspect.signature()` call.
     """
-    if not (inspect.isfunction(obj) or inspect.ismethod(obj)):
+    if type(obj) not in CALLABLE_TYPES:
         return False
 
+    func = getattr(obj, '__func__', obj)
+    key = (func, func is not obj)
+    try:
+        return _simple_callables[key]
+    except KeyError:
+        pass
+
     sig = inspect.signature(obj)
     params = sig.parameters.values()
-    return all(
+    result = all(
         param.kind == param.VAR_POSITIONAL or
         param.kind == param.VAR_KEYWORD or
         param.default != param.empty
         for param in params
     )
+    if len(_simple_callables) >= SIMPLE_CALLABLES_CACHE_SIZE:
+        _simple_callables.clear()
+    _simple_callables[key] = result
+    return result
+
+
+def call_attribute(value, attr):
+    """
+    Call `value` if it is a simple callable, exactly as `get_attribute()`
+    does for each attribute it looks up.
+    """
+    if not is_simple_callable(value):
+        return value
+    try:
+        return value()
+    except (AttributeError, KeyError) as exc:
+        # If we raised an Attribute or KeyError here it'd get treated
+        # as an omitted field in `Field.get_attribute()`. Instead we
+        # raise a ValueError to ensure the exception is not masked.
+        raise ValueError('Exception raised in callable attribute "{0}"; original exception was: {1}'.format(attr, exc))
+
+
+@lru_cache(maxsize=1024)
+def is_mapping_type(cls):
+    """
+    Cached `issubclass(cls, Mapping)`, used by compiled serializers to pick
+    between key and attribute lookups once per instance.
+    """
+    return issubclass(cls, collections.abc.Mapping)
+
+
+@lru_cache(maxsize=4096)
+def get_accessor(cls, attr):
+    """
+    Return a callable that looks up `attr` on instances of `cls`, as one
+    step of `get_attribute()`.
+
+    Whether the lookup is a key or an attribute lookup is resolved once per
+    `(cls, attr)`, and zero-argument callables are detected through the
+    cached `is_simple_callable()`.
+    """
+    if is_mapping_type(cls):
+        def accessor(instance):
+            value = instance[attr]
+            if type(value) in CALLABLE_TYPES:
+                return call_attribute(value, attr)
+            return value
+    else:
+        def accessor(instance):
+            value = getattr(instance, attr)
+            if type(value) in CALLABLE_TYPES:
+                return call_attribute(value, attr)
+            return value
+    return accessor
 
 
 def get_attribute(instance, attrs):
@@ -68,22 +151,52 @@ def get_attribute(instance, attrs):
         if instance is None:
             # Break out early if we get `None` at any point in a nested lookup.
             return None
-        if isinstance(instance, collections.Mapping):
-            instance = instance[attr]
-        else:
-            instance = getattr(instance, attr)
-        if is_simple_callable(instance):
-            try:
-                instance = instance()
-            except (AttributeError, KeyError) as exc:
-                # If we raised an Attribute or KeyError here it'd get treated
-                # as an omitted field in `Field.get_attribute()`. Instead we
-                # raise a ValueError to ensure the exception is not masked.
-                raise ValueError('Exception raised in callable attribute "{0}"; original exception was: {1}'.format(attr, exc))
+        instance = get_accessor(type(instance), attr)(instance)
 
     return instance
 
 
+async def gather_ordered(coros):
+    """
+    Run the coroutines concurrently and return their results in order.
+    If any of them fails, raise the exception of the first failed one in
+    order, so the reported error does not depend on timing.
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+async def await_result(func, value):
+    """
+    Return `func(value)`, awaited if it is awaitable, so that plain
+    functions and coroutine functions can be given alike, including
+    callables returning a coroutine or a future.
+    """
+    result = func(value)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def numeric_column(values, kinds, dtype):
+    """
+    Convert a column of NumPy scalars with a single vectorized cast.
+
+    Returns `None` when NumPy is not installed or the column is not made of
+    NumPy scalars of one of the given dtype `kinds`, so that the caller can
+    fall back to converting the values one by one.
+    """
+    if numpy is None or not isinstance(values[0], numpy.generic):
+        return None
+    array = numpy.asarray(values)
+    if array.dtype.kind not in kinds:
+        return None
+    return array.astype(dtype).tolist()
+
+
 def set_value(dictionary, keys, value):
     """
     Similar to Python's built in `dictionary[key] = value`,
@@ -223,6 +336,9 @@ class Field:
     default_empty_html = empty
     initial = None
     parent = None
+    # Exact value types for which `to_representation()` returns the value
+    # unchanged. Compiled serializers skip the call for these types.
+    identity_types = ()
 
     def __init__(self, label=None, read_only=False, write_only=False,
                  required=None, default=empty, initial=empty, source=None,
@@ -357,22 +473,30 @@ class Field:
         try:
             return get_attribute(instance, self.source_attrs)
         except (KeyError, AttributeError) as exc:
-            if not self.required and self.default is empty:
-                raise exceptions.SkipField()
-            msg = (
-                'Got {exc_type} when attempting to get a value for field '
-                '`{field}` on serializer `{serializer}`.\nThe serializer '
-                'field might be named incorrectly and not match '
-                'any attribute or key on the `{instance}` instance.\n'
-                'Original exception text was: {exc}.'.format(
-                    exc_type=type(exc).__name__,
-                    field=self.field_name,
-                    serializer=self.parent.__class__.__name__,
-                    instance=instance.__class__.__name__,
-                    exc=exc
-                )
+            self.attribute_error(instance, exc)
+
+    def attribute_error(self, instance, exc):
+        """
+        Handle a `KeyError` or `AttributeError` raised while looking up the
+        value for this field. Raise `SkipField` for optional fields, or
+        re-raise the error with a more descriptive message.
+        """
+        if not self.required and self.default is empty:
+            raise exceptions.SkipField()
+        msg = (
+            'Got {exc_type} when attempting to get a value for field '
+            '`{field}` on serializer `{serializer}`.\nThe serializer '
+            'field might be named incorrectly and not match '
+            'any attribute or key on the `{instance}` instance.\n'
+            'Original exception text was: {exc}.'.format(
+                exc_type=type(exc).__name__,
+                field=self.field_name,
+                serializer=self.parent.__class__.__name__,
+                instance=instance.__class__.__name__,
+                exc=exc
             )
-            raise type(exc)(msg)
+        )
+        raise type(exc)(msg)
 
     def get_default(self):
         """
@@ -437,6 +561,11 @@ class Field:
     def run_validators(self, value):
         errors = []
         for validator in self.validators:
+            assert not val.is_async_validator(validator), (
+                '`{cls}` has asynchronous validators. Use '
+                '`is_valid_async()` to validate it.'.format(
+                    cls=self.__class__.__name__)
+            )
             try:
                 validator(value)
             except exceptions.ValidationError as e:
@@ -447,6 +576,63 @@ class Field:
         if errors:
             raise exceptions.ValidationError(detail=errors)
 
+    async def run_validation_async(self, data=empty):
+        """
+        Async counterpart of `run_validation()`, which also awaits async
+        validators and async validation of nested fields.
+        """
+        (is_empty_value, data) = self.validate_empty_values(data)
+        if is_empty_value:
+            return data
+        value = await self.to_internal_value_async(data)
+        await self.run_validators_async(value)
+        return value
+
+    async def to_internal_value_async(self, data):
+        """
+        Async counterpart of `to_internal_value()`. Only fields with nested
+        children need to override it.
+        """
+        return self.to_internal_value(data)
+
+    async def run_validators_async(self, value):
+        """
+        Run synchronous validators and await asynchronous ones concurrently.
+        Errors are reported in the order the validators are declared.
+        """
+        validators = self.validators
+        if not any(val.is_async_validator(v) for v in validators):
+            return self.run_validators(value)
+
+        async def run(validator):
+            try:
+                if val.is_async_validator(validator):
+                    await self.call_async(validator, value)
+                else:
+                    validator(value)
+            except exceptions.ValidationError as e:
+                return {
+                    'detail': e.detail,
+                    'code': self.get_error_code(e.api_code)
+                }
+
+        results = await asyncio.gather(*[run(v) for v in validators])
+        errors = [error for error in results if error is not None]
+        if errors:
+            raise exceptions.ValidationError(detail=errors)
+
+    async def call_async(self, func, value):
+        """
+        Call `func(value)` and await its result if it is awaitable, limited
+        by the concurrency cap of the `is_valid_async()` call in progress on
+        the root serializer.
+        """
+        semaphore = getattr(self.root, '_validation_semaphore', None)
+        if semaphore is None:
+            return await await_result(func, value)
+        async with semaphore:
+            return await await_result(func, value)
+
     def get_error_detail(self, key, **kwargs):
         try:
             msg = self.error_messages[key]
@@ -504,6 +690,14 @@ class Field:
             )
         )
 
+    def to_representation_many(self, values):
+        """
+        Transform a list of *outgoing* native values into primitive data.
+        Used by batch serializers to convert a whole column in one call.
+        `None` values are never passed in.
+        """
+        return [self.to_representation(value) for value in values]
+
     @cached_property
     def root(self):
         """
@@ -521,6 +715,23 @@ class Field:
         """
         return getattr(self.root, '_context', {})
 
+    @cached_property
+    def binary_representation(self):
+        """
+        Whether the output is encoded with a binary renderer, such as
+        MessagePack, in which case datetimes, decimals, UUIDs and binary
+        JSON keep native values. Given by the `binary` context key, else
+        by the renderer negotiated for the request in the context.
+        """
+        binary = self.context.get('binary')
+        if binary is None:
+            request = self.context.get('request')
+            renderer = None
+            if request is not None:
+                renderer = request.get(ACCEPTED_RENDERER_KEY)
+            binary = getattr(renderer, 'binary', False)
+        return binary
+
     def __new__(cls, *args, **kwargs):
         """
         When a field is instantiated, we store the arguments that were used,
@@ -550,6 +761,45 @@ class Field:
             }
         return self.__class__(*args, **kwargs)
 
+    # Instance attributes that belong to a bound field and must not be
+    # carried over by `clone()`.
+    clone_exclude = (
+        'field_name', 'parent', 'root', 'context', 'source_attrs',
+        'binary_representation'
+    )
+    # Initial arguments, only read by `__repr__()`, shared by clones.
+    clone_shared = ('_args', '_kwargs')
+    # Containers which items may be mutable, deep-copied by clones.
+    clone_deep = ('default', 'initial')
+
+    def clone(self):
+        """
+        Return an unbound copy of the field, ready to be bound to a new
+        serializer instance.
+
+        Unlike `copy.deepcopy()`, which re-runs `__init__()` with deep-copied
+        arguments, the clone shares the immutable configuration of the field
+        and only copies its mutable containers.
+        """
+        field = object.__new__(self.__class__)
+        state = self.__dict__.copy()
+        for attr in self.clone_exclude:
+            state.pop(attr, None)
+        for attr, value in list(state.items()):
+            if attr in self.clone_shared:
+                continue
+            if attr in self.clone_deep:
+                if isinstance(value, (list, dict, set)):
+                    state[attr] = copy.deepcopy(value)
+            elif isinstance(value, (list, dict, set)):
+                # Eg `error_messages` or the `choices` of a ChoiceField,
+                # which items are immutable.
+                state[attr] = value.copy()
+        field.__dict__.update(state)
+        field.field_name = None
+        field.parent = None
+        return field
+
     def __repr__(self):
         """
         Fields are represented using their initial calling arguments.
@@ -566,6 +816,7 @@ class BooleanField(Field):
         'invalid': '"{input}" is not a valid boolean.'
     }
     initial = False
+    identity_types = (bool,)
     TRUE_VALUES = {
         't', 'T',
         'true', 'True', 'TRUE',
@@ -609,6 +860,7 @@ class NullBooleanField(Field):
         'invalid': '"{input}" is not a valid boolean.'
     }
     initial = None
+    identity_types = (bool,)
     TRUE_VALUES = {'t', 'T', 'true', 'True', 'TRUE', '1', 1, True}
     FALSE_VALUES = {'f', 'F', 'false', 'False', 'FALSE', '0', 0, 0.0, False}
     NULL_VALUES = {'n', 'N', 'null', 'Null', 'NULL', '', None}
@@ -647,6 +899,7 @@ class CharField(Field):
         'min_length': 'Ensure this field has at least {min_length} characters.'
     }
     initial = ''
+    identity_types = (str,)
 
     def __init__(self, **kwargs):
         self.allow_blank = kwargs.pop('allow_blank', False)
@@ -671,6 +924,13 @@ class CharField(Field):
             return ''
         return super(CharField, self).run_validation(data)
 
+    async def run_validation_async(self, data=empty):
+        if data == '' or (self.trim_whitespace and str(data).strip() == ''):
+            if not self.allow_blank:
+                self.fail('blank')
+            return ''
+        return await super(CharField, self).run_validation_async(data)
+
     def to_internal_value(self, data):
         # We're lenient with allowing basic numerics to be coerced into strings,
         # but other types should fail. Eg. unclear if booleans should represent as `true` or `True`,
@@ -683,6 +943,9 @@ class CharField(Field):
     def to_representation(self, value):
         return str(value)
 
+    def to_representation_many(self, values):
+        return list(map(str, values))
+
 
 class EmailField(CharField):
     default_error_messages = {
@@ -750,6 +1013,8 @@ class UUIDField(Field):
             try:
                 if isinstance(data, int):
                     return uuid.UUID(int=data)
+                elif isinstance(data, bytes):
+                    return uuid.UUID(bytes=data)
                 elif isinstance(data, str):
                     return uuid.UUID(hex=data)
                 else:
@@ -759,11 +1024,20 @@ class UUIDField(Field):
         return data
 
     def to_representation(self, value):
+        if self.binary_representation and isinstance(value, uuid.UUID):
+            return value.bytes
         if self.uuid_format == 'hex_verbose':
             return str(value)
         else:
             return getattr(value, self.uuid_format)
 
+    def to_representation_many(self, values):
+        if self.binary_representation:
+            return [self.to_representation(value) for value in values]
+        if self.uuid_format == 'hex_verbose':
+            return list(map(str, values))
+        return list(map(operator.attrgetter(self.uuid_format), values))
+
 
 class IPAddressField(CharField):
     """Support both IPAddressField and GenericIPAddressField"""
@@ -803,6 +1077,7 @@ class IntegerField(Field):
         'max_string_length': 'String value too large.'
     }
     MAX_STRING_LENGTH = 1000  # Guard against malicious string inputs.
+    identity_types = (int,)
     re_decimal = re.compile(r'\.0*\s*$')  # allow e.g. '1.0' as an int, but not '1.2'
 
     def __init__(self, **kwargs):
@@ -829,6 +1104,15 @@ class IntegerField(Field):
     def to_representation(self, value):
         return int(value)
 
+    def to_representation_many(self, values):
+        converted = numeric_column(values, 'bi', 'int64')
+        if converted is None:
+            # Unsigned values above 2 ** 63 - 1 would wrap in int64.
+            converted = numeric_column(values, 'u', 'uint64')
+        if converted is None:
+            converted = list(map(int, values))
+        return converted
+
 
 class FloatField(Field):
     default_error_messages = {
@@ -838,6 +1122,7 @@ class FloatField(Field):
         'max_string_length': 'String value too large.'
     }
     MAX_STRING_LENGTH = 1000  # Guard against malicious string inputs.
+    identity_types = (float,)
 
     def __init__(self, **kwargs):
         self.max_value = kwargs.pop('max_value', None)
@@ -863,6 +1148,12 @@ class FloatField(Field):
     def to_representation(self, value):
         return float(value)
 
+    def to_representation_many(self, values):
+        converted = numeric_column(values, 'biuf', 'float64')
+        if converted is None:
+            converted = list(map(float, values))
+        return converted
+
 
 class DecimalField(Field):
     default_error_messages = {
@@ -1060,6 +1351,10 @@ class DateTimeField(Field):
         if output_format is None or isinstance(value, str):
             return value
 
+        if self.binary_representation:
+            # Sent as a timestamp by binary renderers.
+            return self.enforce_timezone(value)
+
         if output_format.lower() == ISO_8601:
             value = value.isoformat()
             if value.endswith('+00:00'):
@@ -1067,6 +1362,24 @@ class DateTimeField(Field):
             return value
         return value.strftime(output_format)
 
+    def to_representation_many(self, values):
+        output_format = getattr(self, 'format', api_settings.DATETIME_FORMAT)
+
+        if (output_format is None or output_format.lower() != ISO_8601 or
+                self.binary_representation):
+            return super(DateTimeField, self).to_representation_many(values)
+
+        ret = []
+        for value in values:
+            if not value:
+                value = None
+            elif not isinstance(value, str):
+                value = value.isoformat()
+                if value.endswith('+00:00'):
+                    value = value[:-6] + 'Z'
+            ret.append(value)
+        return ret
+
 
 class DateField(Field):
     default_error_messages = {
@@ -1227,6 +1540,7 @@ class ChoiceField(Field):
     }
     html_cutoff = None
     html_cutoff_text = 'More than {count} items...'
+    clone_deep = Field.clone_deep + ('grouped_choices',)
 
     def __init__(self, choices, **kwargs):
         self.grouped_choices = to_choices_dict(choices)
@@ -1259,6 +1573,13 @@ class ChoiceField(Field):
             return value
         return self.choice_strings_to_values.get(str(value), value)
 
+    def to_representation_many(self, values):
+        lookup = self.choice_strings_to_values.get
+        return [
+            value if value == '' else lookup(str(value), value)
+            for value in values
+        ]
+
     def iter_options(self):
         """
         Helper method for use with templates rendering select widgets.
@@ -1416,6 +1737,13 @@ class ListField(Field):
             message = self.error_messages['min_length'].format(min_length=self.min_length)
             self.validators.append(val.MinLengthValidator(self.min_length, message=message))
 
+    def clone(self):
+        field = super(ListField, self).clone()
+        field.child = self.child.clone()
+        field.child.source = None
+        field.child.bind(field_name='', parent=field)
+        return field
+
     def get_value(self, dictionary):
         if self.field_name not in dictionary:
             if getattr(self.root, 'partial', False):
@@ -1434,13 +1762,23 @@ class ListField(Field):
         """
         List of dicts of native values <- List of dicts of primitive datatypes.
         """
+        data = self._get_list(data)
+        return [self.child.run_validation(item) for item in data]
+
+    async def to_internal_value_async(self, data):
+        data = self._get_list(data)
+        return await gather_ordered([
+            self.child.run_validation_async(item) for item in data
+        ])
+
+    def _get_list(self, data):
         if html.is_html_input(data):
             data = html.parse_html_list(data)
         if isinstance(data, type('')) or isinstance(data, collections.Mapping) or not hasattr(data, '__iter__'):
             self.fail('not_a_list', input_type=type(data).__name__)
         if not self.allow_empty and len(data) == 0:
             self.fail('empty')
-        return [self.child.run_validation(item) for item in data]
+        return data
 
     def to_representation(self, data):
         """
@@ -1468,6 +1806,13 @@ class DictField(Field):
         super(DictField, self).__init__(*args, **kwargs)
         self.child.bind(field_name='', parent=self)
 
+    def clone(self):
+        field = super(DictField, self).clone()
+        field.child = self.child.clone()
+        field.child.source = None
+        field.child.bind(field_name='', parent=field)
+        return field
+
     def get_value(self, dictionary):
         # We override the default field access in order to support
         # dictionaries in HTML forms.
@@ -1488,6 +1833,17 @@ class DictField(Field):
             for key, value in data.items()
         }
 
+    async def to_internal_value_async(self, data):
+        if html.is_html_input(data):
+            data = html.parse_html_dict(data)
+        if not isinstance(data, dict):
+            self.fail('not_a_dict', input_type=type(data).__name__)
+        keys = [str(key) for key in data]
+        values = await gather_ordered([
+            self.child.run_validation_async(value) for value in data.values()
+        ])
+        return dict(zip(keys, values))
+
     def to_representation(self, value):
         """
         List of object instances -> List of dicts of primitive datatypes.
@@ -1521,7 +1877,8 @@ class JSONField(Field):
 
     def to_internal_value(self, data):
         try:
-            if self.binary or getattr(data, 'is_json_string', False):
+            if ((self.binary and isinstance(data, (str, bytes))) or
+                    getattr(data, 'is_json_string', False)):
                 if isinstance(data, bytes):
                     data = data.decode('utf-8')
                 return json.loads(data)
@@ -1532,7 +1889,7 @@ class JSONField(Field):
         return data
 
     def to_representation(self, value):
-        if self.binary:
+        if self.binary and not self.binary_representation:
             value = json.dumps(value)
             # On python 2.x the return type for json.dumps() is underspecified.
             # On python 3.x json.dumps() returns unicode strings.
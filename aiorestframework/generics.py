@@ -1,12 +1,18 @@
 import copy
+import warnings
 from inspect import isclass
 from functools import wraps
 
 from aiohttp import hdrs
 from aiohttp.web_urldispatcher import UrlDispatcher
 
-from aiorestframework import exceptions
-from aiorestframework.permissions import BasePermission
+from aiorestframework import etags, exceptions
+from aiorestframework.cache import get_resource_name, permission_cache
+from aiorestframework.negotiation import ACCEPTED_RENDERER_KEY
+from aiorestframework.parsers import BaseParser, LazyRequestData
+from aiorestframework.permissions import BasePermission, first_denial
+from aiorestframework.renderers import BaseRenderer
+from aiorestframework.response import Response
 from aiorestframework.settings import api_settings
 
 
@@ -24,6 +30,12 @@ class GenericViewSet:
     detail_postfix = 'detail'
     lookup_url_kwarg = '{id}'
     permission_classes = []
+    renderer_classes = None
+    parser_classes = None
+    content_negotiation_class = None
+    use_etags = None
+    concurrent_permissions = None
+    permission_cache = None
 
     def __new__(cls, *args, **kwargs):
         obj = super().__new__(cls)
@@ -38,69 +50,267 @@ class GenericViewSet:
             assert issubclass(permission, BasePermission), \
                 'Permission class should be inherited from "BasePermission".'
             obj._permission_classes.append(permission)
+        # Build renderers list, shared by all handlers without own renderers
+        renderer_classes = cls.renderer_classes
+        if renderer_classes is None:
+            renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES
+        obj._renderers = []
+        for renderer in renderer_classes:
+            assert issubclass(renderer, BaseRenderer), \
+                'Renderer class should be inherited from "BaseRenderer".'
+            obj._renderers.append(renderer())
+        # Build parsers list, shared by all handlers without own parsers
+        parser_classes = cls.parser_classes
+        if parser_classes is None:
+            parser_classes = api_settings.DEFAULT_PARSER_CLASSES
+        obj._parsers = []
+        for parser in parser_classes:
+            assert issubclass(parser, BaseParser), \
+                'Parser class should be inherited from "BaseParser".'
+            obj._parsers.append(parser())
+        negotiation_class = cls.content_negotiation_class
+        if negotiation_class is None:
+            negotiation_class = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS
+        obj._content_negotiator = negotiation_class()
+        obj._use_etags = cls.use_etags
+        if obj._use_etags is None:
+            obj._use_etags = api_settings.USE_ETAGS
+        obj._concurrent_permissions = cls.concurrent_permissions
+        if obj._concurrent_permissions is None:
+            obj._concurrent_permissions = api_settings.CONCURRENT_PERMISSIONS
+        obj._permission_cache = cls.permission_cache
+        if obj._permission_cache is None:
+            obj._permission_cache = permission_cache
         return obj
 
-    def _get_handler(self, handler, action,
-                     is_list_action=False, is_detail_action=False):
+    def _get_pipeline(self, handler, action, method,
+                      is_list_action=False, is_detail_action=False):
         """
-        Return wrapped handler for given ViewSet action.
+        Return the coroutine serving `method` requests for given ViewSet
+        action. It is composed once, at registration, of the stages that
+        apply to the route only: permission checks are skipped when there
+        are no permissions, and conditional GET handling for other methods
+        or when ETags are disabled.
 
         :param handler: ViewSet handler, that proceed given action.
         :param action: Action string name.
+        :param method: HTTP method of the route.
         :return: Wrapped handler.
         """
         # Bind action types to handler
         handler.__dict__['is_list_action'] = is_list_action
         handler.__dict__['is_detail_action'] = is_detail_action
+        renderers = self.get_handler_renderers(handler)
+        parsers = self.get_handler_parsers(handler)
+        permissions = []
+        if api_settings.ENABLE_PERMISSIONS_CHECK:
+            if (type(self).set_handler_permissions is not
+                    GenericViewSet.set_handler_permissions):
+                # Subclasses overriding the former hook keep working.
+                warnings.warn(
+                    '%s overrides set_handler_permissions(), override '
+                    'get_handler_permissions() instead.' % type(self).__name__,
+                    DeprecationWarning)
+                permissions = self.set_handler_permissions(
+                    wraps(handler)(lambda request: None)).permissions
+            else:
+                permissions = self.get_handler_permissions(handler)
+        check_permissions = self.check_permissions
+        if self._concurrent_permissions:
+            check_permissions = self.check_permissions_concurrently
+        select_renderer = self._content_negotiator.select_renderer
+        conditional = self._use_etags and method in etags.ETAG_METHODS
+        versioned = conditional and (
+            type(self).get_version_token is not GenericViewSet.get_version_token)
 
         @wraps(handler)
-        async def wrapper(request):
+        async def pipeline(request):
             # Bind action name to request
-            setattr(request, 'action', action)
+            request.action = action
+            # Bind lazily parsed body, `request.data` is left to middlewares
+            request.parsed_data = LazyRequestData(request, parsers)
+            if permissions:
+                await check_permissions(request, handler, permissions)
+            # Negotiate before the handler runs, to fail early with 406
+            renderer, media_type = select_renderer(request, renderers)
+            request[ACCEPTED_RENDERER_KEY] = renderer
+            etag = None
+            if versioned:
+                # Skip the handler if the client has the current version
+                token = await self.get_version_token(request)
+                if token is not None:
+                    etag = etags.compute_version_etag(
+                        request, media_type, token)
+                    if etags.etag_matches(request, etag):
+                        return etags.not_modified(etag)
             result = await handler(request)
+            if isinstance(result, Response):
+                await result.render_async(renderer)
+                if conditional:
+                    result = self.finalize_conditional(request, result, etag)
             return result
-        return wrapper
+
+        pipeline.permissions = permissions
+        return pipeline
+
+    async def get_version_token(self, request):
+        """
+        Return a cheap version token of the resource requested by a GET,
+        e.g. its `updated_at`, or `None` if it is unknown.
+
+        When a token is returned, the ETag is derived from it and requests
+        with a matching `If-None-Match` get a 304 without running the
+        handler. Use `request.action` to tell the actions apart.
+        """
+        return None
+
+    def finalize_conditional(self, request, response, etag=None):
+        """
+        Set the ETag of a successful rendered response, computed from its
+        body unless given, and replace the response with a 304 if the
+        client already has it.
+        """
+        if response.status != 200:
+            return response
+        if hdrs.ETAG in response.headers:
+            etag = response.headers[hdrs.ETAG]
+        elif etag is None:
+            body = response.body
+            if not isinstance(body, (bytes, bytearray)):
+                return response
+            etag = etags.compute_etag(body)
+        if etags.etag_matches(request, etag):
+            return etags.not_modified(etag)
+        response.headers[hdrs.ETAG] = etag
+        return response
+
+    def get_handler_renderers(self, handler):
+        """
+        Instantiates and returns the list of renderers for this handler.
+        """
+        if hasattr(handler, 'renderer_classes'):
+            return [renderer() for renderer in handler.renderer_classes]
+        return self._renderers
+
+    def get_handler_parsers(self, handler):
+        """
+        Instantiates and returns the list of parsers for this handler.
+        """
+        if hasattr(handler, 'parser_classes'):
+            return [parser() for parser in handler.parser_classes]
+        return self._parsers
 
     # -----------
     # Permissions
-    def _check_permissions_wrapper(self, handler):
+    async def check_permissions(self, request, handler, permissions):
         """
         Check if the request should be permitted.
         Raises an appropriate exception if the request is not permitted.
         """
-        @wraps(handler)
-        async def wrapper(request):
-            if hasattr(handler, 'permissions'):
-                for permission in handler.permissions:
-                    # Check permission
-                    has_permission = await permission.check_permission(
-                        request, handler, self)
-                    if not has_permission:
-                        await self.permission_denied(
-                            request,
-                            message=getattr(permission, 'message', None),
-                            api_code=getattr(permission, 'api_code', None))
-            result = await handler(request)
-            return result
-        return wrapper
+        for permission in permissions:
+            has_permission = await self.evaluate_permission(
+                request, handler, permission)
+            if not has_permission:
+                await self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    api_code=getattr(permission, 'api_code', None))
+
+    async def check_permissions_concurrently(self, request, handler,
+                                             permissions):
+        """
+        Same as `check_permissions()`, but the permissions are checked
+        concurrently, for those doing I/O. The pending checks are cancelled
+        as soon as one denies, and the error is the one of the first
+        denying permission in declaration order, as with sequential checks.
+        Enabled by `concurrent_permissions` or `CONCURRENT_PERMISSIONS`.
+        """
+        denied = await first_denial([
+            self.evaluate_permission(
+                request, handler, permission, concurrently=True)
+            for permission in permissions
+        ])
+        if denied is not None:
+            permission = permissions[denied]
+            await self.permission_denied(
+                request,
+                message=getattr(permission, 'message', None),
+                api_code=getattr(permission, 'api_code', None))
+
+    async def evaluate_permission(self, request, handler, permission,
+                                  concurrently=False):
+        """
+        Return the decision of `permission` for the request. Decisions of
+        permissions with `cache_decisions` set are cached in the
+        `permission_cache` by (permission class, principal key, resource
+        name, object key, HTTP method), for the requests with a principal
+        key.
+        """
+        key = None
+        if permission.cache_decisions:
+            principal = self.get_principal_key(request)
+            if principal is not None:
+                object_key = None
+                if getattr(handler, 'is_detail_action', False):
+                    object_key = self.get_object_key(request)
+                key = (type(permission), principal,
+                       get_resource_name(self, request), object_key,
+                       request.method)
+                decision = self._permission_cache.lookup(key)
+                if decision is not None:
+                    return decision
+
+        if concurrently:
+            decision = await permission.check_permission_concurrently(
+                request, handler, self)
+        else:
+            decision = await permission.check_permission(
+                request, handler, self)
+        if key is not None:
+            self._permission_cache.set(key, bool(decision))
+        return decision
+
+    def get_principal_key(self, request):
+        """
+        Return a hashable key of the authenticated principal, e.g. the user
+        id, or `None` to disable the permission decision cache.
+        """
+        return None
+
+    def get_object_key(self, request):
+        """
+        Return a hashable key of the object requested by a detail action,
+        the URL match info by default.
+        """
+        return tuple(sorted(request.match_info.items()))
 
     async def permission_denied(self, request, message, api_code):
         raise exceptions.PermissionDenied(detail=message, api_code=api_code)
 
-    def set_handler_permissions(self, handler):
+    def get_handler_permissions(self, handler):
         """
         Instantiates and returns the list of permissions that this handler requires.
         """
         if hasattr(handler, 'permission_classes'):
             permission_classes = handler.permission_classes
             if handler.include_viewset_permissions is True:
-                permission_classes += self._permission_classes
+                permission_classes = (
+                    permission_classes + self._permission_classes)
         else:
             permission_classes = self._permission_classes
 
-        permissions = [permission() for permission in permission_classes]
-        handler.permissions = permissions
+        return [permission() for permission in permission_classes]
 
+    def set_handler_permissions(self, handler):
+        """
+        Deprecated, use `get_handler_permissions()`. Sets the permissions
+        of the handler to its `permissions` attribute and returns it.
+        """
+        warnings.warn(
+            'set_handler_permissions() is deprecated, use '
+            'get_handler_permissions() instead.', DeprecationWarning,
+            stacklevel=2)
+        handler.permissions = self.get_handler_permissions(handler)
         return handler
 
     # --------------------------
@@ -223,16 +433,9 @@ class GenericViewSet:
             if handler is not None:
                 methods = self._build_methods_list(declared_methods)
                 for m in methods:
-                    wrapped_handler = self._get_handler(
-                        handler, action, is_list_action, is_detail_action)
-
-                    # Add permissions to handler if permissions check enabled
-                    if api_settings.ENABLE_PERMISSIONS_CHECK:
-                        self.set_handler_permissions(wrapped_handler)
-                        wrapped_handler = self._check_permissions_wrapper(
-                            wrapped_handler)
-
-                    resource.add_route(m, wrapped_handler)
+                    pipeline = self._get_pipeline(
+                        handler, action, m, is_list_action, is_detail_action)
+                    resource.add_route(m, pipeline)
 
         return resource
 
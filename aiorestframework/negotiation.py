@@ -0,0 +1,121 @@
+"""
+Content negotiation deals with selecting an appropriate renderer given the
+incoming request. Typically this will be based on the request's Accept header.
+"""
+from functools import lru_cache
+
+from aiohttp import hdrs
+
+from aiorestframework import exceptions
+from aiorestframework.settings import api_settings
+
+
+__all__ = (
+    'BaseContentNegotiation', 'DefaultContentNegotiation'
+)
+
+
+# Key of the parsed Accept header in the request mapping.
+ACCEPTED_MEDIA_TYPES_KEY = 'accepted_media_types'
+
+# Key of the renderer negotiated by the ViewSet in the request mapping.
+ACCEPTED_RENDERER_KEY = 'accepted_renderer'
+
+
+@lru_cache(maxsize=256)
+def parse_accept_header(value):
+    """
+    Parse an Accept header into a tuple of media types, most preferred
+    first. Media types with the same quality are ordered from the most
+    specific to the least specific, and `q=0` ones are dropped.
+
+    'text/*;q=0.5, application/json' -> ('application/json', 'text/*')
+    """
+    entries = []
+    for position, part in enumerate(value.split(',')):
+        params = [param.strip() for param in part.split(';')]
+        media_type = params[0].lower()
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params[1:]:
+            key, _, param_value = param.partition('=')
+            if key.strip() == 'q':
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        if quality <= 0:
+            continue
+        main_type, _, sub_type = media_type.partition('/')
+        specificity = (main_type != '*') + (sub_type != '*')
+        entries.append((-quality, -specificity, position, media_type))
+    return tuple(entry[3] for entry in sorted(entries))
+
+
+def media_type_matches(renderer_media_type, accepted_media_type):
+    """
+    Whether the renderer media type satisfies an accepted media type,
+    which may use wildcards.
+    """
+    if accepted_media_type == '*/*':
+        return True
+    main_type, _, sub_type = accepted_media_type.partition('/')
+    renderer_main_type, _, renderer_sub_type = renderer_media_type.partition('/')
+    return (
+        main_type == renderer_main_type and
+        sub_type in ('*', renderer_sub_type)
+    )
+
+
+class BaseContentNegotiation:
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        raise NotImplementedError('.select_renderer() must be implemented')
+
+
+class DefaultContentNegotiation(BaseContentNegotiation):
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        """
+        Given a request and a list of renderers, return a two-tuple of:
+        (renderer, media type).
+        """
+        # Allow URL style format override. eg. "?format=json
+        format_query_param = api_settings.URL_FORMAT_OVERRIDE
+        format = format_suffix or request.query.get(format_query_param)
+
+        if format:
+            renderers = self.filter_renderers(renderers, format)
+
+        for media_type in self.get_accept_list(request):
+            for renderer in renderers:
+                if media_type_matches(renderer.media_type, media_type):
+                    return renderer, renderer.media_type
+
+        raise exceptions.NotAcceptable()
+
+    def filter_renderers(self, renderers, format):
+        """
+        If there is a '.json' style format suffix, filter the renderers
+        so that we only negotiation against those that accept that format.
+        """
+        renderers = [renderer for renderer in renderers
+                     if renderer.format == format]
+        if not renderers:
+            raise exceptions.NotAcceptable()
+        return renderers
+
+    def get_accept_list(self, request):
+        """
+        Given the incoming request, return the parsed Accept header,
+        cached on the request so that it is parsed once per request.
+        """
+        try:
+            return request[ACCEPTED_MEDIA_TYPES_KEY]
+        except KeyError:
+            pass
+        header = request.headers.get(hdrs.ACCEPT, '*/*')
+        accept_list = parse_accept_header(header) or ('*/*',)
+        request[ACCEPTED_MEDIA_TYPES_KEY] = accept_list
+        return accept_list
@@ -0,0 +1,412 @@
+"""
+Pagination serializers determine the structure of the output that should
+be used for paginated responses.
+
+Paginators don't know about the storage backend. They describe the rows
+they need with a `PageQuery`, and a `fetch(query)` coroutine given by the
+handler runs it. One row more than the page size is fetched to know if
+there is a next page, so that no count is needed, and the cursor
+paginator seeks from the last row of the previous page instead of
+skipping rows, so deep pages cost the same as the first one.
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import warnings
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from aiorestframework import exceptions
+from aiorestframework.renderers import encode_default
+from aiorestframework.response import Response
+from aiorestframework.settings import api_settings
+
+
+__all__ = (
+    'PageQuery', 'BasePagination', 'PageNumberPagination',
+    'LimitOffsetPagination', 'CursorPagination', 'sequence_fetcher'
+)
+
+
+# Signs the cursors when `CURSOR_SECRET_KEY` isn't set. Such cursors are
+# only valid in the process that made them.
+PROCESS_SECRET_KEY = os.urandom(32)
+
+PROCESS_SECRET_KEY_WARNING = (
+    'CURSOR_SECRET_KEY is not set: cursors are signed with a key of this '
+    'process only, and are rejected by other workers and after a restart. '
+    'Set CURSOR_SECRET_KEY to the same secret on every worker.'
+)
+
+# Bytes of the cursor signature.
+CURSOR_SIGNATURE_SIZE = 16
+
+
+def positive_int(value, strict=False, cutoff=None):
+    """
+    Cast a string to a strictly positive integer.
+    """
+    value = int(value)
+    if value < 0 or (strict and value == 0):
+        raise ValueError()
+    if cutoff:
+        return min(value, cutoff)
+    return value
+
+
+def get_query_int(request, param, default, strict=False, cutoff=None):
+    """
+    Return a positive integer query parameter, or `default` if it is
+    missing or invalid.
+    """
+    try:
+        return positive_int(request.query[param], strict, cutoff)
+    except (KeyError, ValueError):
+        return default
+
+
+def replace_query_params(url, params):
+    return url.update_query(
+        {key: str(value) for key, value in params.items()})
+
+
+def remove_query_param(url, key):
+    query = [(name, value) for name, value in url.query.items() if name != key]
+    return url.with_query(query)
+
+
+def reverse_ordering(ordering):
+    return tuple(
+        field[1:] if field.startswith('-') else '-' + field
+        for field in ordering
+    )
+
+
+class PageQuery:
+    """
+    Description of the rows of a page, for the `fetch(query)` coroutine,
+    which returns a list of at most `limit` rows, or of all of them if it
+    is `None`, skipping the first `offset` ones.
+
+    Cursor pagination gives the `ordering` of the rows, where fields
+    prefixed with "-" are descending, and `after`, the values of these
+    fields in the last row of the previous page, if any. Only the rows
+    which sort strictly after it must be returned, eg for ascending
+    fields: `WHERE (a, b) > ($1, $2) ORDER BY a, b LIMIT $3`.
+    Values of `after` went through JSON, so dates are ISO 8601 strings.
+    """
+    __slots__ = ('limit', 'offset', 'after', 'ordering')
+
+    def __init__(self, limit=None, offset=0, after=None, ordering=()):
+        self.limit = limit
+        self.offset = offset
+        self.after = after
+        self.ordering = ordering
+
+    def __repr__(self):
+        return '<PageQuery limit=%r offset=%r after=%r ordering=%r>' % (
+            self.limit, self.offset, self.after, self.ordering)
+
+
+class BasePagination:
+    """
+    A paginator is instantiated for each request.
+
+    `page_size` defaults to the `PAGE_SIZE` setting, and clients can
+    request another one with `page_size_query_param`, up to
+    `max_page_size`. Without page size, all rows are returned as is.
+    """
+    page_size = None
+    page_size_query_param = None
+    max_page_size = None
+
+    def __init__(self):
+        self.count = None
+        self.paginated = True
+
+    def get_page_size(self, request):
+        page_size = self.page_size
+        if page_size is None:
+            page_size = api_settings.PAGE_SIZE
+        if self.page_size_query_param:
+            page_size = get_query_int(
+                request, self.page_size_query_param, page_size,
+                strict=True, cutoff=self.max_page_size)
+        return page_size
+
+    async def paginate(self, request, fetch, count=None):
+        """
+        Return the rows of the requested page.
+
+        :param request: Current request.
+        :param fetch: Coroutine function returning the rows of a `PageQuery`.
+        :param count: Optional coroutine function returning the number of
+         rows, included in the response if given.
+        :return: List of rows.
+        """
+        if count is not None:
+            self.count = await count()
+        page_size = self.get_page_size(request)
+        if page_size is None:
+            self.paginated = False
+            return list(await fetch(PageQuery()))
+        return await self.paginate_rows(request, fetch, page_size)
+
+    async def paginate_rows(self, request, fetch, page_size):
+        raise NotImplementedError('paginate_rows() must be implemented.')
+
+    def get_next_link(self):
+        raise NotImplementedError('get_next_link() must be implemented.')
+
+    def get_previous_link(self):
+        raise NotImplementedError('get_previous_link() must be implemented.')
+
+    def get_paginated_data(self, data):
+        if not self.paginated:
+            return data
+        ret = OrderedDict()
+        if self.count is not None:
+            ret['count'] = self.count
+        ret['next'] = self.get_next_link()
+        ret['previous'] = self.get_previous_link()
+        ret['results'] = data
+        return ret
+
+    def get_paginated_response(self, data):
+        return Response(data=self.get_paginated_data(data))
+
+
+class PageNumberPagination(BasePagination):
+    """
+    A simple page number based style that supports page numbers as
+    query parameters. For example:
+
+    http://api.example.org/accounts/?page=4
+    """
+    page_query_param = 'page'
+    invalid_page_message = 'Invalid page.'
+
+    async def paginate_rows(self, request, fetch, page_size):
+        self.url = request.url
+        try:
+            self.page_number = positive_int(
+                request.query.get(self.page_query_param, 1), strict=True)
+        except ValueError:
+            raise exceptions.NotFound(detail=self.invalid_page_message)
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(await fetch(PageQuery(page_size + 1, offset)))
+        if not rows and self.page_number > 1:
+            raise exceptions.NotFound(detail=self.invalid_page_message)
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return str(replace_query_params(
+            self.url, {self.page_query_param: self.page_number + 1}))
+
+    def get_previous_link(self):
+        if self.page_number == 1:
+            return None
+        if self.page_number == 2:
+            return str(remove_query_param(self.url, self.page_query_param))
+        return str(replace_query_params(
+            self.url, {self.page_query_param: self.page_number - 1}))
+
+
+class LimitOffsetPagination(BasePagination):
+    """
+    A limit/offset based style. For example:
+
+    http://api.example.org/accounts/?limit=100
+    http://api.example.org/accounts/?offset=400&limit=100
+    """
+    page_size_query_param = 'limit'
+    offset_query_param = 'offset'
+
+    async def paginate_rows(self, request, fetch, page_size):
+        self.url = request.url
+        self.limit = page_size
+        self.offset = get_query_int(request, self.offset_query_param, 0)
+        rows = list(await fetch(PageQuery(page_size + 1, self.offset)))
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return str(replace_query_params(self.url, {
+            self.page_size_query_param: self.limit,
+            self.offset_query_param: self.offset + self.limit,
+        }))
+
+    def get_previous_link(self):
+        if self.offset <= 0:
+            return None
+        url = replace_query_params(
+            self.url, {self.page_size_query_param: self.limit})
+        if self.offset - self.limit <= 0:
+            return str(remove_query_param(url, self.offset_query_param))
+        return str(replace_query_params(
+            url, {self.offset_query_param: self.offset - self.limit}))
+
+
+class CursorPagination(BasePagination):
+    """
+    Keyset pagination. The cursor is opaque to clients: it holds the
+    `ordering` values of the row the page starts after, and the direction,
+    signed with the `CURSOR_SECRET_KEY` setting, which must be the same on
+    every worker. The `ordering` must end with a unique field, so that
+    every row has a distinct key.
+
+    http://api.example.org/accounts/?cursor=WzAsWzQyXV0.uL0oZ8eW3Hm0c0F8Y2m_ZA
+    """
+    cursor_query_param = 'cursor'
+    ordering = ('id',)
+    invalid_cursor_message = 'Invalid cursor.'
+
+    async def paginate_rows(self, request, fetch, page_size):
+        self.url = request.url
+        reverse, after = self.decode_cursor(request)
+        ordering = self.ordering
+        if reverse:
+            ordering = reverse_ordering(ordering)
+
+        rows = list(await fetch(PageQuery(
+            page_size + 1, after=after, ordering=ordering)))
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            # Previous pages are fetched backwards from their last row.
+            rows.reverse()
+            self.has_next, self.has_previous = after is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, after is not None
+
+        self.first_key = self.last_key = None
+        if rows:
+            self.first_key = self.get_row_key(rows[0])
+            self.last_key = self.get_row_key(rows[-1])
+        return rows
+
+    def get_row_key(self, row):
+        """
+        Return the `ordering` values of a row, a mapping or an object.
+        """
+        fields = [field.lstrip('-') for field in self.ordering]
+        if isinstance(row, Mapping):
+            return tuple(row[field] for field in fields)
+        return tuple(getattr(row, field) for field in fields)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.last_key is None:
+            # The page before the first row of an empty page is the first.
+            return str(remove_query_param(self.url, self.cursor_query_param))
+        return str(replace_query_params(self.url, {
+            self.cursor_query_param: self.encode_cursor(False, self.last_key)
+        }))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        # Without first row, the previous page is the last one.
+        return str(replace_query_params(self.url, {
+            self.cursor_query_param: self.encode_cursor(True, self.first_key)
+        }))
+
+    def get_secret_key(self):
+        secret_key = api_settings.CURSOR_SECRET_KEY
+        if secret_key is None:
+            warnings.warn(PROCESS_SECRET_KEY_WARNING, RuntimeWarning)
+            return PROCESS_SECRET_KEY
+        if isinstance(secret_key, str):
+            secret_key = secret_key.encode('utf-8')
+        return secret_key
+
+    def sign(self, payload):
+        # Cursors of another ordering are rejected.
+        message = payload + b'.' + ','.join(self.ordering).encode('utf-8')
+        digest = hmac.new(self.get_secret_key(), message, hashlib.sha256)
+        return digest.digest()[:CURSOR_SIGNATURE_SIZE]
+
+    def encode_cursor(self, reverse, key):
+        """
+        Return the opaque cursor of the page after `key`, or before it if
+        `reverse` is set.
+        """
+        payload = json.dumps(
+            [int(reverse), list(key) if key is not None else None],
+            default=encode_default, separators=(',', ':')).encode('utf-8')
+        return '.'.join((
+            base64.urlsafe_b64encode(payload).decode('ascii').rstrip('='),
+            base64.urlsafe_b64encode(self.sign(payload)).decode('ascii').rstrip('=')
+        ))
+
+    def decode_cursor(self, request):
+        """
+        Return the `(reverse, key)` tuple of the request cursor, which is
+        `(False, None)` for the first page.
+        """
+        cursor = request.query.get(self.cursor_query_param)
+        if not cursor:
+            return False, None
+        try:
+            payload, signature = (
+                base64.urlsafe_b64decode(part + '=' * (-len(part) % 4))
+                for part in cursor.split('.')
+            )
+            if not hmac.compare_digest(signature, self.sign(payload)):
+                raise ValueError()
+            reverse, key = json.loads(payload.decode('utf-8'))
+        except (TypeError, ValueError, binascii.Error):
+            raise exceptions.NotFound(detail=self.invalid_cursor_message)
+        if key is not None:
+            key = tuple(key)
+        return bool(reverse), key
+
+
+def sequence_fetcher(items):
+    """
+    Return a `fetch` coroutine function over a list of rows in memory,
+    mappings or objects, which is also a reference of the `PageQuery`
+    semantics for backend implementations.
+    """
+    async def fetch(query):
+        rows = items
+        if query.ordering:
+            fields = [
+                (field.lstrip('-'), field.startswith('-'))
+                for field in query.ordering
+            ]
+
+            def get(row, name):
+                if isinstance(row, Mapping):
+                    return row[name]
+                return getattr(row, name)
+
+            rows = list(rows)
+            for name, descending in reversed(fields):
+                rows.sort(key=lambda row: get(row, name), reverse=descending)
+
+            if query.after is not None:
+                def is_after(row):
+                    for (name, descending), value in zip(fields, query.after):
+                        row_value = get(row, name)
+                        if row_value != value:
+                            return (row_value < value) == descending
+                    return False
+                rows = [row for row in rows if is_after(row)]
+
+        end = None
+        if query.limit is not None:
+            end = query.offset + query.limit
+        return list(rows[query.offset:end])
+
+    return fetch
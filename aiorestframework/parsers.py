@@ -0,0 +1,310 @@
+"""
+Parsers are used to parse the content of incoming HTTP requests.
+
+They give us a generic way of being able to handle various media types
+on the request, such as form content or json encoded data.
+"""
+import re
+
+import ujson
+from aiohttp import hdrs, web_exceptions
+from multidict import MultiDict, MultiDictProxy
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from aiorestframework import exceptions
+from aiorestframework.settings import api_settings
+from aiorestframework.utils.binary import unpack_ext
+
+
+__all__ = (
+    'BaseParser', 'JSONParser', 'MessagePackParser', 'FormParser',
+    'MultiPartParser', 'LazyRequestData', 'set_parsers'
+)
+
+
+# A JSON string, once the escaped characters are removed.
+JSON_STRING_RE = re.compile(rb'"[^"]*"')
+
+# Every byte but the quotes and the structural characters.
+JSON_NON_STRUCTURAL = bytes(set(range(256)) - set(b'"[]{},'))
+
+JSON_OPENING_BRACKETS = frozenset(b'[{')
+
+# Methods which request body is parsed.
+DATA_METHODS = (
+    hdrs.METH_POST, hdrs.METH_PUT, hdrs.METH_PATCH, hdrs.METH_DELETE
+)
+
+
+def set_parsers(parsers):
+    """
+    Set parser classes for handler, instead of the ViewSet ones
+
+    :param parsers: List of parser classes
+    :return: wrapped handler with .parser_classes attribute
+    """
+    def wrapper(handler):
+        assert isinstance(parsers, (tuple, list)),\
+            'Parsers should be a list of Parsers.'
+        for parser in parsers:
+            assert issubclass(parser, BaseParser), \
+                'Parser class should be inherited from "BaseParser".'
+
+        # Bind parser_classes to function
+        handler.parser_classes = list(parsers)
+
+        return handler
+
+    return wrapper
+
+
+def check_json_limits(body, max_depth=None, max_items=None):
+    """
+    Check the nesting depth and the number of items of a raw JSON document
+    before decoding it.
+
+    The counts of brackets and commas are upper bounds of the depth and
+    the number of items, so most documents are accepted right away.
+    Otherwise the strings are stripped and the limits are checked on the
+    remaining structural characters, with bytes operations only.
+    Malformed documents are left to the decoder.
+    """
+    containers = body.count(b'[') + body.count(b'{')
+    if ((max_depth is None or containers <= max_depth) and
+            (max_items is None or containers + body.count(b',') <= max_items)):
+        return
+
+    # Drop escaped backslashes first, so that the remaining `\\"` are
+    # escaped quotes. Then only the quotes and structural characters are
+    # kept, and the strings without structural characters, now empty, are
+    # removed before the remaining ones.
+    body = body.replace(b'\\\\', b'').replace(b'\\"', b'')
+    structure = body.translate(None, JSON_NON_STRUCTURAL).replace(b'""', b'')
+    structure = JSON_STRING_RE.sub(b'', structure)
+
+    if max_items is not None:
+        items = (structure.count(b',') + structure.count(b'[') +
+                 structure.count(b'{'))
+        if items > max_items:
+            raise exceptions.RequestEntityTooLarge(
+                detail='JSON document has more than %d items.' % max_items)
+
+    if max_depth is not None:
+        # Only the brackets are left, the depth is their running level.
+        level = 0
+        for char in structure.translate(None, b',"'):
+            if char in JSON_OPENING_BRACKETS:
+                level += 1
+                if level > max_depth:
+                    raise exceptions.ParseError(
+                        detail='JSON parse error - nesting is deeper than %d.'
+                        % max_depth)
+            else:
+                level -= 1
+
+
+class BaseParser:
+    """
+    All parsers should extend `BaseParser`, specifying a `media_type`
+    attribute, and overriding the `.parse()` method.
+    """
+    media_type = None
+    max_bytes = None
+
+    def get_max_bytes(self):
+        if self.max_bytes is not None:
+            return self.max_bytes
+        return api_settings.PARSER_MAX_BYTES
+
+    def check_content_length(self, request):
+        """
+        Reject bodies that announce a size above the limit, before reading.
+        """
+        max_bytes = self.get_max_bytes()
+        if max_bytes is not None and request.content_length is not None:
+            if request.content_length > max_bytes:
+                raise exceptions.RequestEntityTooLarge()
+
+    async def read(self, request):
+        """
+        Return the raw body bytes, enforcing the size limit. The body is
+        read in chunks, so that chunked bodies are rejected as soon as they
+        go over the limit, without buffering them.
+        """
+        self.check_content_length(request)
+        max_bytes = self.get_max_bytes()
+        if max_bytes is None:
+            return await request.read()
+        body = bytearray()
+        while True:
+            chunk = await request.content.readany()
+            if not chunk:
+                break
+            body.extend(chunk)
+            if len(body) > max_bytes:
+                raise exceptions.RequestEntityTooLarge()
+        return bytes(body)
+
+    async def read_form(self, request):
+        """
+        Return the parsed form data, enforcing the size limit while reading
+        with the `client_max_size` of aiohttp, chunked bodies included.
+        """
+        self.check_content_length(request)
+        max_bytes = self.get_max_bytes()
+        if max_bytes is not None:
+            request = request.clone(client_max_size=max_bytes)
+        try:
+            return await request.post()
+        except web_exceptions.HTTPRequestEntityTooLarge:
+            raise exceptions.RequestEntityTooLarge()
+
+    async def parse(self, request, parser_context=None):
+        """
+        Given the request, return the parsed data.
+        """
+        raise NotImplementedError('.parse() must be overridden.')
+
+
+class JSONParser(BaseParser):
+    """
+    Parses JSON-serialized data straight from the body bytes, with
+    `orjson` if it is installed and `ujson` otherwise.
+    """
+    media_type = 'application/json'
+    max_depth = None
+    max_items = None
+
+    async def parse(self, request, parser_context=None):
+        body = await self.read(request)
+        return self.parse_bytes(body)
+
+    def parse_bytes(self, body):
+        """
+        Decode a raw JSON document, given as bytes or memoryview.
+        """
+        if isinstance(body, memoryview):
+            body = body.tobytes()
+
+        max_depth = self.max_depth
+        if max_depth is None:
+            max_depth = api_settings.JSON_MAX_DEPTH
+        max_items = self.max_items
+        if max_items is None:
+            max_items = api_settings.JSON_MAX_ITEMS
+        check_json_limits(body, max_depth, max_items)
+
+        try:
+            if orjson is not None:
+                return orjson.loads(body)
+            return ujson.loads(body)
+        except (ValueError, RecursionError) as exc:
+            raise exceptions.ParseError(detail='JSON parse error - %s' % exc)
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses MessagePack-serialized data, if `msgpack` is installed.
+    Timestamps are decoded to aware datetimes and the decimal extension
+    type to `Decimal`, see `utils.binary`.
+
+    `JSON_MAX_ITEMS` bounds the length of every array and map, and the
+    nesting depth is bounded by the fixed stack of the decoder.
+    """
+    media_type = 'application/msgpack'
+    max_items = None
+
+    def __init__(self):
+        assert msgpack is not None, \
+            'msgpack must be installed to use MessagePackParser'
+
+    async def parse(self, request, parser_context=None):
+        body = await self.read(request)
+        return self.parse_bytes(body)
+
+    def parse_bytes(self, body):
+        """
+        Decode a raw MessagePack document, given as bytes or memoryview.
+        """
+        max_items = self.max_items
+        if max_items is None:
+            max_items = api_settings.JSON_MAX_ITEMS
+        if max_items is None:
+            max_items = -1
+
+        try:
+            return msgpack.unpackb(
+                body, raw=False, timestamp=3, ext_hook=unpack_ext,
+                strict_map_key=False,
+                max_array_len=max_items, max_map_len=max_items)
+        except (ValueError, TypeError) as exc:
+            raise exceptions.ParseError(
+                detail='MessagePack parse error - %s' % exc)
+
+
+class FormParser(BaseParser):
+    """
+    Parser for form data.
+    """
+    media_type = 'application/x-www-form-urlencoded'
+
+    async def parse(self, request, parser_context=None):
+        return await self.read_form(request)
+
+
+class MultiPartParser(BaseParser):
+    """
+    Parser for multipart form data, which may include file data.
+    """
+    media_type = 'multipart/form-data'
+
+    async def parse(self, request, parser_context=None):
+        return await self.read_form(request)
+
+
+class LazyRequestData:
+    """
+    Coroutine function bound to `request.parsed_data` on the ViewSet path.
+    The body is parsed on the first `await request.parsed_data()`, with
+    the parser matching the request content type, and the result is cached
+    for later calls. If a middleware set `request.data`, it is returned
+    as is, since the body was already read. Requests without a body give
+    an empty `MultiDictProxy`.
+    """
+
+    def __init__(self, request, parsers):
+        self._request = request
+        self._parsers = parsers
+        self._parsed = False
+        self._data = None
+
+    async def __call__(self):
+        if not self._parsed:
+            self._data = await self.parse()
+            self._parsed = True
+        return self._data
+
+    def select_parser(self):
+        content_type = self._request.content_type
+        for parser in self._parsers:
+            if parser.media_type == content_type:
+                return parser
+        raise exceptions.UnsupportedMediaType(media_type=content_type)
+
+    async def parse(self):
+        request = self._request
+        if hasattr(request, 'data'):
+            return request.data
+        if not request.body_exists or request.method not in DATA_METHODS:
+            return MultiDictProxy(MultiDict())
+        parser = self.select_parser()
+        return await parser.parse(request)
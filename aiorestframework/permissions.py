@@ -1,9 +1,10 @@
+import asyncio
 from functools import wraps
 
 from aiohttp.hdrs import METH_GET, METH_HEAD, METH_OPTIONS
 
 __all__ = (
-    'SAFE_METHODS', 'BasePermission', 'AllowAny'
+    'SAFE_METHODS', 'BasePermission', 'AllowAny', 'first_denial'
 )
 
 
@@ -37,10 +38,58 @@ def set_permissions(permissions, include_viewset_permissions=False):
     return wrapper
 
 
+async def first_denial(checks):
+    """
+    Run the `checks` coroutines concurrently and return the index of the
+    first one, in the given order, that returns a false value, or `None`
+    if all of them pass. An exception raised by a check is a denial, and
+    is raised again if it is the first one.
+
+    The checks after a denied one are cancelled as soon as it is known,
+    while the ones before it are still awaited, so that the outcome is the
+    same as with sequential checks.
+    """
+    tasks = [asyncio.ensure_future(check) for check in checks]
+    positions = {task: index for index, task in enumerate(tasks)}
+    denied = None
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled():
+                    continue
+                if task.exception() is None and task.result():
+                    continue
+                if denied is None or positions[task] < denied:
+                    denied = positions[task]
+            if denied is not None:
+                for task in tasks[denied + 1:]:
+                    task.cancel()
+                pending = {
+                    task for task in pending if positions[task] < denied}
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    if denied is not None:
+        exc = tasks[denied].exception()
+        if exc is not None:
+            raise exc
+    return denied
+
+
 class BasePermission(object):
     """
     A base class from which all permission classes should inherit.
+
+    Set `cache_decisions` on expensive permissions which decision only
+    depends on the principal and the resource, to cache it, see
+    `GenericViewSet.evaluate_permission()`.
     """
+    cache_decisions = False
 
     async def check_permission(self, request, handler, view):
         """
@@ -57,6 +106,21 @@ class BasePermission(object):
         else:
             return True
 
+    async def check_permission_concurrently(self, request, handler, view):
+        """
+        Same as `check_permission()`, but `has_permission()` and
+        `has_object_permission()` run concurrently on detail actions.
+        Overridden `check_permission()` methods are used as is.
+        """
+        if (type(self).check_permission is not BasePermission.check_permission or
+                not getattr(handler, 'is_detail_action', False)):
+            return await self.check_permission(request, handler, view)
+        denied = await first_denial([
+            self.has_permission(request, handler, view),
+            self.has_object_permission(request, handler, view),
+        ])
+        return denied is None
+
     async def has_permission(self, request, handler, view):
         """
         Return `True` if permission is granted, `False` otherwise.
@@ -0,0 +1,222 @@
+"""
+Renderers are used to serialize a response into specific media types.
+
+They give us a generic way of being able to handle various media types
+on the response, such as JSON encoded data. The JSON renderers differ only
+in the encoder they use, so the fastest one available can be picked per
+endpoint without changing the output format.
+"""
+import datetime
+import decimal
+import json
+import uuid
+from itertools import islice
+
+import ujson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from aiorestframework.settings import api_settings
+from aiorestframework.utils.binary import pack_default
+
+
+__all__ = (
+    'BaseRenderer', 'JSONRenderer', 'UJSONRenderer', 'ORJSONRenderer',
+    'MessagePackRenderer', 'set_renderers', 'estimate_size'
+)
+
+
+# Containers are sized from a sample of their first items, which gets
+# smaller with the depth so that the estimate stays cheap.
+ESTIMATE_SAMPLE_SIZE = 8
+ESTIMATE_MAX_DEPTH = 6
+
+
+def set_renderers(renderers):
+    """
+    Set renderer classes for handler, instead of the ViewSet ones
+
+    :param renderers: List of renderer classes
+    :return: wrapped handler with .renderer_classes attribute
+    """
+    def wrapper(handler):
+        assert isinstance(renderers, (tuple, list)),\
+            'Renderers should be a list of Renderers.'
+        for renderer in renderers:
+            assert issubclass(renderer, BaseRenderer), \
+                'Renderer class should be inherited from "BaseRenderer".'
+
+        # Bind renderer_classes to function
+        handler.renderer_classes = list(renderers)
+
+        return handler
+
+    return wrapper
+
+
+def encode_default(obj):
+    """
+    Fallback for the types that the JSON encoders can't serialize natively.
+    """
+    if isinstance(obj, datetime.datetime):
+        representation = obj.isoformat()
+        if representation.endswith('+00:00'):
+            representation = representation[:-6] + 'Z'
+        return representation
+    elif isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    elif isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    elif isinstance(obj, decimal.Decimal):
+        # Serializers for float fields should be used for float values.
+        return str(obj)
+    elif isinstance(obj, uuid.UUID):
+        return str(obj)
+    elif isinstance(obj, (bytes, bytearray)):
+        return obj.decode()
+    elif isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError('Object of type %s is not JSON serializable.' %
+                    type(obj).__name__)
+
+
+def estimate_size(data, depth=0):
+    """
+    Cheap estimate of the encoded size of `data` in bytes, extrapolated
+    from the first items of every container.
+    """
+    if isinstance(data, (str, bytes, bytearray)):
+        return len(data) + 2
+    if depth >= ESTIMATE_MAX_DEPTH:
+        return 8
+
+    sample_size = max(ESTIMATE_SAMPLE_SIZE >> depth, 1)
+    if isinstance(data, dict):
+        sample = list(islice(data.items(), sample_size))
+        size = sum(
+            len(str(key)) + 4 + estimate_size(value, depth + 1)
+            for key, value in sample
+        )
+    elif isinstance(data, (list, tuple)):
+        sample = data[:sample_size]
+        size = sum(estimate_size(item, depth + 1) + 1 for item in sample)
+    else:
+        return 8
+
+    if not sample:
+        return 2
+    return size * len(data) // len(sample) + 2
+
+
+class BaseRenderer:
+    """
+    All renderers should extend this class, setting the `media_type`
+    and `format` attributes, and override the `.render()` method.
+
+    Binary renderers set `binary`, so that serializer fields keep native
+    values, such as datetimes or decimals, instead of strings.
+    """
+    media_type = None
+    format = None
+    charset = 'utf-8'
+    binary = False
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Return the encoded `data` as bytes.
+        """
+        raise NotImplementedError('Renderer class requires .render() to be implemented')
+
+
+class JSONRenderer(BaseRenderer):
+    """
+    Renderer which serializes to JSON with the standard library encoder.
+    Always available, but the slowest of the JSON renderers.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    # Escape non-ASCII characters, `None` follows the `UNICODE_JSON` setting.
+    ensure_ascii = None
+
+    def get_ensure_ascii(self):
+        if self.ensure_ascii is None:
+            return not api_settings.UNICODE_JSON
+        return self.ensure_ascii
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if api_settings.COMPACT_JSON:
+            separators = (',', ':')
+        else:
+            separators = (', ', ': ')
+
+        text = json.dumps(
+            data, default=encode_default, separators=separators,
+            ensure_ascii=self.get_ensure_ascii()
+        )
+        return text.encode(self.charset)
+
+
+class UJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to JSON with `ujson`. Non-ASCII characters
+    are escaped by default, so that the output is byte-identical to the
+    `ujson.dumps()` responses rendered before renderers existed.
+    """
+    ensure_ascii = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        text = ujson.dumps(data, ensure_ascii=self.get_ensure_ascii())
+        return text.encode(self.charset)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to JSON with `orjson`, if it is installed.
+    `orjson` always emits compact UTF-8.
+    """
+
+    def __init__(self):
+        assert orjson is not None, 'orjson must be installed to use ORJSONRenderer'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return orjson.dumps(
+            data, default=encode_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renderer which serializes to MessagePack, if `msgpack` is installed.
+    Datetimes, decimals and UUIDs are encoded as binary values, see
+    `utils.binary`.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    binary = True
+
+    def __init__(self):
+        assert msgpack is not None, \
+            'msgpack must be installed to use MessagePackRenderer'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return msgpack.packb(data, use_bin_type=True, default=pack_default)
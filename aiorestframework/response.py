@@ -1,22 +1,263 @@
-import ujson as json
-from aiohttp.web import Response as AiohttpResponse
+import asyncio
+from inspect import isclass
+from itertools import islice
+
+from aiohttp.web import Response as AiohttpResponse, StreamResponse
+
+from aiorestframework.compression import compress_response
+from aiorestframework.exceptions import NotAcceptable
+from aiorestframework.renderers import UJSONRenderer, estimate_size
+from aiorestframework.settings import api_settings
+
+
+__all__ = (
+    'Response', 'JSONStreamResponse', 'NDJSONStreamResponse'
+)
 
 
 class Response(AiohttpResponse):
     """
-    Response class passed application/json content_type as default
+    Response class that renders `data` with a renderer, which is
+    `application/json` by default.
+
+    Rendering is deferred until `render()` is called, either by the ViewSet
+    with the negotiated renderer or at the latest when the response is
+    prepared, so handlers can still change `data` after creating it.
+    An explicit `renderer` always wins over negotiation.
+
+    Renderers encode straight to bytes. Pre-encoded `bytes` or `memoryview`
+    passed as `data` are sent as is, as `application/json` unless another
+    `content_type` is given, so cached payloads skip serialization:
+
+        return Response(data=cached_body)
+
+    Bodies are compressed with the coding negotiated from `Accept-Encoding`
+    when `compress` is set, or else when it is enabled on the
+    `APIApplication` or by the `COMPRESSION_ENABLED` setting.
+
+    Large payloads are encoded in an executor by `render_async()`, which
+    the ViewSet and `prepare()` use, see `RENDER_EXECUTOR_THRESHOLD`.
     """
 
     def __init__(self, *, data=None, status=200, body=None,
                  reason=None, text=None, headers=None, content_type=None,
-                 charset=None):
-        if content_type is None and data is not None:
-            content_type = 'application/json'
-        if data is not None and not body and not text:
-            text = json.dumps(data)
-        else:
-            text = text
-
+                 charset=None, renderer=None, compress=None):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            body, data = data, None
+            if content_type is None:
+                content_type = 'application/json'
+                charset = charset or api_settings.DEFAULT_CHARSET
         super().__init__(body=body, status=status, reason=reason, text=text,
                          headers=headers, content_type=content_type,
                          charset=charset)
+        self.data = data
+        self.renderer = renderer
+        self.compress = compress
+        self.is_rendered = (
+            data is None or body is not None or text is not None)
+        self._content_type_override = content_type
+        self._charset_override = charset
+
+    def get_renderer(self, renderer=None, request=None):
+        """
+        Return `self.renderer`, else the given one, else the one negotiated
+        for `request` among `DEFAULT_RENDERER_CLASSES`, else the first
+        default renderer.
+        """
+        if self.renderer is not None:
+            renderer = self.renderer
+        elif renderer is None:
+            renderer = get_default_renderer(request)
+        if isclass(renderer):
+            renderer = renderer()
+        return renderer
+
+    def render(self, renderer=None, request=None):
+        """
+        Encode `data` into the body, with the renderer picked by
+        `get_renderer()`.
+        """
+        if self.is_rendered:
+            return
+
+        renderer = self.get_renderer(renderer, request)
+        self.set_rendered_body(renderer, renderer.render(self.data))
+
+    async def render_async(self, renderer=None, request=None):
+        """
+        Same as `render()`, but payloads which estimated encoded size is at
+        least `RENDER_EXECUTOR_THRESHOLD` bytes are encoded in the
+        `RENDER_EXECUTOR`, the default executor if it is `None`, so that
+        the event loop keeps serving other requests meanwhile.
+        """
+        if self.is_rendered:
+            return
+
+        threshold = api_settings.RENDER_EXECUTOR_THRESHOLD
+        if threshold is None or estimate_size(self.data) < threshold:
+            self.render(renderer, request)
+            return
+
+        renderer = self.get_renderer(renderer, request)
+        loop = asyncio.get_event_loop()
+        body = await loop.run_in_executor(
+            api_settings.RENDER_EXECUTOR, renderer.render, self.data)
+        self.set_rendered_body(renderer, body)
+
+    def set_rendered_body(self, renderer, body):
+        self.renderer = renderer
+        self.content_type = self._content_type_override or renderer.media_type
+        charset = self._charset_override or renderer.charset
+        if charset:
+            self.charset = charset
+        self.body = body
+        self.is_rendered = True
+
+    async def prepare(self, request):
+        await self.render_async(request=request)
+        if not self.prepared:
+            await compress_response(self, request)
+        return await super().prepare(request)
+
+
+def get_default_renderer(request=None):
+    """
+    Return the default renderer negotiated for `request`, falling back on
+    the first of `DEFAULT_RENDERER_CLASSES`.
+    """
+    renderers = [
+        renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES
+    ]
+    if request is not None:
+        negotiator = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+        try:
+            return negotiator.select_renderer(request, renderers)[0]
+        except NotAcceptable:
+            pass
+    return renderers[0]
+
+
+class JSONStreamResponse(StreamResponse):
+    """
+    Response class that streams the representation of a `many=True`
+    serializer as a JSON array.
+
+    Items are serialized, encoded and written `chunk_size` at a time, so
+    peak memory is bounded by the chunk size rather than the list length.
+    The output is the same as `Response(data=serializer.data)` rendered
+    with the same JSON `renderer`, `UJSONRenderer` by default.
+    Return it from a handler like any other response:
+
+        return JSONStreamResponse(UserSerializer(users, many=True))
+    """
+
+    def __init__(self, serializer, *, chunk_size=None, status=200,
+                 reason=None, headers=None, charset=None, renderer=None):
+        assert hasattr(serializer, 'child'), (
+            'JSONStreamResponse expects a serializer created with `many=True`.'
+        )
+        super().__init__(status=status, reason=reason, headers=headers)
+        self.renderer = renderer() if isclass(renderer) else renderer
+        if self.renderer is None:
+            self.renderer = UJSONRenderer()
+        self.content_type = self.renderer.media_type
+        self.charset = charset or api_settings.DEFAULT_CHARSET
+        self.serializer = serializer
+        self.chunk_size = chunk_size or api_settings.STREAM_CHUNK_SIZE
+        self._streamed = False
+
+    async def prepare(self, request):
+        writer = await super().prepare(request)
+        if not self._streamed:
+            self._streamed = True
+            await self.stream()
+        return writer
+
+    def iter_chunks(self):
+        """
+        Yield lists of representations of at most `chunk_size` items.
+        """
+        items = iter(self.serializer.instance)
+        while True:
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk:
+                return
+            yield self.serializer.to_representation(chunk)
+
+    async def stream(self):
+        """
+        Write the JSON array chunk by chunk. Headers are already sent at
+        this point, so an exception aborts the connection.
+        """
+        opening = b'['
+        for rows in self.iter_chunks():
+            body = self.renderer.render(rows)
+            await self.write(opening + body[1:-1])
+            opening = b','
+        await self.write(b'[]' if opening == b'[' else b']')
+
+
+class NDJSONStreamResponse(JSONStreamResponse):
+    """
+    Response class that streams the representation of a `many=True`
+    serializer as newline-delimited JSON, one line per item.
+
+    The serializer instance may be an async iterator, e.g. a database
+    cursor. Each item goes through the child serializer and is written as
+    soon as it is available, waiting for the transport to drain when
+    the client reads slower than items are produced:
+
+        return NDJSONStreamResponse(UserSerializer(cursor, many=True))
+
+    Lines of plain iterables, which are all available, are written in
+    batches of `flush_size` bytes, `STREAM_FLUSH_SIZE` by default.
+    Lines of async iterators are batched only if `flush_size` is given,
+    in which case a pause of the iterator delays the buffered lines.
+    """
+    media_type = 'application/x-ndjson'
+
+    def __init__(self, serializer, *, status=200, reason=None, headers=None,
+                 charset=None, renderer=None, flush_size=None):
+        super().__init__(serializer, status=status, reason=reason,
+                         headers=headers, charset=charset, renderer=renderer)
+        self.content_type = self.media_type
+        self.flush_size = flush_size
+
+    async def stream(self):
+        """
+        Write one JSON line per item. Headers are already sent at this
+        point, so an exception aborts the connection.
+        """
+        items = self.serializer.instance
+        flush_size = self.flush_size
+        buffer = []
+        buffered = 0
+
+        if hasattr(items, '__aiter__'):
+            async for instance in items:
+                line = self.render_line(instance)
+                if flush_size is None:
+                    await self.write(line)
+                    continue
+                buffer.append(line)
+                buffered += len(line)
+                if buffered >= flush_size:
+                    await self.write(b''.join(buffer))
+                    buffer, buffered = [], 0
+        else:
+            if flush_size is None:
+                flush_size = api_settings.STREAM_FLUSH_SIZE
+            for instance in items:
+                line = self.render_line(instance)
+                buffer.append(line)
+                buffered += len(line)
+                if buffered >= flush_size:
+                    await self.write(b''.join(buffer))
+                    buffer, buffered = [], 0
+
+        if buffer:
+            await self.write(b''.join(buffer))
+
+    def render_line(self, instance):
+        row = self.serializer.child.to_representation(instance)
+        return self.renderer.render(row) + b'\n'
@@ -1,5 +1,8 @@
 import collections
 from collections import OrderedDict
+from functools import lru_cache, partial
+
+from aiorestframework.fields import Field, get_attribute
 
 
 class ReturnDict(OrderedDict):
@@ -25,6 +28,25 @@ class ReturnDict(OrderedDict):
         return (dict, (dict(self),))
 
 
+class ReturnPlainDict(dict):
+    """
+    Same as `ReturnDict`, but backed by a plain insertion-ordered `dict`.
+    Used by serializers with `Meta.plain_dicts = True`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.serializer = kwargs.pop('serializer')
+        super(ReturnPlainDict, self).__init__(*args, **kwargs)
+
+    def copy(self):
+        return ReturnPlainDict(self, serializer=self.serializer)
+
+    def __reduce__(self):
+        # Pickling these objects will drop the .serializer backlink,
+        # but preserve the raw data.
+        return (dict, (dict(self),))
+
+
 class ReturnList(list):
     """
     Return object from `serializer.data` for the `SerializerList` class.
@@ -141,3 +163,146 @@ class BindingDict(collections.MutableMapping):
 
     def __repr__(self):
         return dict.__repr__(self.fields)
+
+
+def get_representation_class(field_class):
+    """
+    Return the class that implements `to_representation()` for the field
+    class. Shortcuts declared on that class are safe to use, while
+    shortcuts inherited from further up the MRO may not match the
+    overridden method.
+    """
+    for klass in field_class.__mro__:
+        if 'to_representation' in klass.__dict__:
+            return klass
+    return Field
+
+
+def get_column_converter(field):
+    """
+    Return a callable that converts a list of non-`None` values for the
+    field, using the field's `to_representation_many()` when it is declared
+    alongside its `to_representation()`.
+    """
+    klass = get_representation_class(type(field))
+    if 'to_representation_many' in klass.__dict__:
+        return field.to_representation_many
+    return partial(Field.to_representation_many, field)
+
+
+@lru_cache(maxsize=1024)
+def build_plan_template(serializer_class, field_specs):
+    template = []
+    for field_name, field_class, source_attrs in field_specs:
+        custom_getter = field_class.get_attribute is not Field.get_attribute
+        attr = getter = None
+        if not custom_getter:
+            if len(source_attrs) == 1:
+                attr = source_attrs[0]
+            else:
+                getter = partial(get_attribute, attrs=source_attrs)
+        klass = get_representation_class(field_class)
+        template.append((
+            field_name, attr, getter, custom_getter,
+            'to_representation_many' in klass.__dict__,
+            frozenset(klass.__dict__.get('identity_types', ()))
+        ))
+    return tuple(template)
+
+
+def get_plan_template(serializer_class, fields):
+    """
+    Return the part of the output plan that doesn't depend on the field
+    instances, as `(field_name, attr, getter, custom_getter,
+    column_converter, identity_types)` tuples.
+
+    Fields with a single-attribute source get `attr` set and are looked up
+    inline; any other field is resolved through `getter`, which is `None`
+    for fields with their own `get_attribute()`. The template is cached by
+    serializer class and `(field_name, field_class, source_attrs)` of the
+    fields, so it is built once per class and field set.
+    """
+    return build_plan_template(serializer_class, tuple(
+        (field.field_name, type(field), tuple(field.source_attrs))
+        for field in fields
+    ))
+
+
+def build_representation_plan(template, fields):
+    """
+    Bind a plan template to the field instances, for batch serializers.
+
+    Each entry is a tuple of `(field_name, field, attr, getter,
+    custom_getter, convert, convert_many, identity_types)`.
+    """
+    plan = []
+    for field, (field_name, attr, getter, custom_getter, column_converter,
+                identity_types) in zip(fields, template):
+        if custom_getter:
+            getter = field.get_attribute
+        if column_converter:
+            convert_many = field.to_representation_many
+        else:
+            convert_many = partial(Field.to_representation_many, field)
+        plan.append((
+            field_name, field, attr, getter, custom_getter,
+            field.to_representation, convert_many, identity_types
+        ))
+    return tuple(plan)
+
+
+def freeze_fieldset(tree):
+    return tuple(sorted(
+        (name, None if subtree is None else freeze_fieldset(subtree))
+        for name, subtree in tree.items()
+    ))
+
+
+@lru_cache(maxsize=1024)
+def parse_fieldset(value):
+    """
+    Parse a comma separated list of dotted field paths into a hashable tree.
+
+    'id,author.name,author.email' ->
+        (('author', (('email', None), ('name', None))), ('id', None))
+
+    A `None` subtree selects the whole field. A bare field name wins over
+    dotted paths below it.
+    """
+    tree = {}
+    for path in value.split(','):
+        names = [name.strip() for name in path.split('.')]
+        if not all(names):
+            continue
+        node = tree
+        for name in names[:-1]:
+            node = node.setdefault(name, {})
+            if node is None:
+                break
+        else:
+            node[names[-1]] = None
+    return freeze_fieldset(tree)
+
+
+def get_fieldset_subtree(fields, exclude, field_name):
+    """
+    Return the `(fields, exclude)` trees that apply to a nested field.
+    """
+    subtree = dict(fields).get(field_name) if fields else None
+    excluded = dict(exclude).get(field_name) if exclude else None
+    return subtree or (), excluded or ()
+
+
+@lru_cache(maxsize=1024)
+def get_projection(serializer_class, field_names, fields, exclude):
+    """
+    Return the subset of `field_names` selected by the `fields` and
+    `exclude` trees. Cached per serializer class and projection.
+    """
+    selected = dict(fields)
+    excluded = dict(exclude)
+    return tuple(
+        field_name for field_name in field_names
+        if (not fields or field_name in selected) and
+        not (field_name in excluded and excluded[field_name] is None)
+    )
@@ -1,16 +1,23 @@
+import asyncio
 import copy
 import inspect
 import traceback
 from collections import Mapping, OrderedDict
 
+from aiorestframework.settings import api_settings
 from aiorestframework.utils import html, representation
 from aiorestframework.utils.functional import cached_property
 from .exceptions import SkipField, ValidationError
 
 from .fields import *
+from .fields import (
+    CALLABLE_TYPES, call_attribute, is_mapping_type
+)
 
 from .serializer_helpers import (
-    BindingDict, BoundField, NestedBoundField, ReturnDict, ReturnList
+    BindingDict, BoundField, NestedBoundField, ReturnDict, ReturnList,
+    ReturnPlainDict, build_representation_plan, get_column_converter,
+    get_fieldset_subtree, get_plan_template, get_projection, parse_fieldset
 )
 
 
@@ -22,10 +29,16 @@ LIST_SERIALIZER_KWARGS = (
     'instance', 'data', 'partial', 'context', 'allow_null'
 )
 
+# Passed to the `ListSerializer` only, see `many_init()`.
+LIST_VALIDATION_KWARGS = ('fail_fast', 'max_errors', 'sparse_errors')
+
 ALL_FIELDS = '__all__'
 
 NON_FIELD_ERRORS_KEY = 'non_field_errors'  # TODO Move to settings
 
+# Child serializer arguments that are not sent to worker processes.
+OFFLOAD_EXCLUDED_KWARGS = ('instance', 'data', 'context', 'many')
+
 
 # BaseSerializer
 class BaseSerializer(Field):
@@ -87,12 +100,20 @@ class BaseSerializer(Field):
             return CustomListSerializer(*args, **kwargs)
         """
         allow_empty = kwargs.pop('allow_empty', None)
+        batch = kwargs.pop('batch', None)
+        validation_kwargs = {
+            key: kwargs.pop(key) for key in LIST_VALIDATION_KWARGS
+            if key in kwargs
+        }
         child_serializer = cls(*args, **kwargs)
         list_kwargs = {
             'child': child_serializer,
         }
+        list_kwargs.update(validation_kwargs)
         if allow_empty is not None:
             list_kwargs['allow_empty'] = allow_empty
+        if batch is not None:
+            list_kwargs['batch'] = batch
         list_kwargs.update({
             key: value for key, value in kwargs.items()
             if key in LIST_SERIALIZER_KWARGS
@@ -101,6 +122,12 @@ class BaseSerializer(Field):
         list_serializer_class = getattr(meta, 'list_serializer_class', ListSerializer)
         return list_serializer_class(*args, **list_kwargs)
 
+    # Per-instance state of a serializer that must not be shared by clones.
+    clone_exclude = Field.clone_exclude + (
+        'initial_data', '_data', '_validated_data', '_errors',
+        '_return_data', '_return_errors'
+    )
+
     def to_internal_value(self, data):
         raise NotImplementedError('`to_internal_value()` must be implemented.')
 
@@ -183,6 +210,53 @@ class BaseSerializer(Field):
 
         return not bool(self._errors)
 
+    async def is_valid_async(self, raise_exception=False):
+        """
+        Async counterpart of `is_valid()`, that awaits async validators and
+        `validate_<field>` coroutines. Independent validators run
+        concurrently, at most `get_validation_concurrency()` at a time.
+        """
+        assert hasattr(self, 'initial_data'), (
+            'Cannot call `.is_valid_async()` as no `data=` keyword argument '
+            'was passed when instantiating the serializer instance.'
+        )
+
+        if not hasattr(self, '_validated_data'):
+            self._validation_semaphore = asyncio.Semaphore(
+                self.get_validation_concurrency())
+            try:
+                self._validated_data = await self.run_validation_async(
+                    self.initial_data)
+            except ValidationError as exc:
+                self._validated_data = self.get_empty_validated_data()
+                self._errors = exc.detail
+            else:
+                self._errors = self.get_empty_validated_data()
+            finally:
+                del self._validation_semaphore
+
+        if self._errors and raise_exception:
+            raise ValidationError(detail=self.errors)
+
+        return not bool(self._errors)
+
+    def get_validation_concurrency(self):
+        """
+        Maximum number of async validators awaited at the same time.
+        """
+        meta = getattr(self, 'Meta', None)
+        return getattr(meta, 'async_concurrency',
+                       api_settings.ASYNC_VALIDATION_CONCURRENCY)
+
+    def get_empty_validated_data(self):
+        return {}
+
+    async def validate_async(self, attrs):
+        value = self.validate(attrs)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
     @property
     def data(self):
         if hasattr(self, 'initial_data') and not hasattr(self, '_validated_data'):
@@ -256,6 +330,128 @@ class SerializerMetaclass(type):
         return super(SerializerMetaclass, cls).__new__(cls, name, bases, attrs)
 
 
+def validate_items(child, items, max_errors=None, sparse=False, start=0):
+    """
+    Validate the items with the `child` serializer. Returns the list of
+    validated items and the errors of the items.
+
+    Errors are a list in which valid items have an empty dict or, if
+    `sparse` is set, a dict of the errors of the invalid items keyed by
+    their index, counted from `start`. Validation stops once `max_errors`
+    items have failed.
+    """
+    ret = []
+    errors = OrderedDict() if sparse else []
+    error_count = 0
+
+    for index, item in enumerate(items, start):
+        try:
+            validated = child.run_validation(item)
+        except ValidationError as exc:
+            if sparse:
+                errors[index] = exc.detail
+            else:
+                errors.append(exc.detail)
+            error_count += 1
+            if max_errors is not None and error_count >= max_errors:
+                break
+        else:
+            ret.append(validated)
+            if not sparse:
+                errors.append({})
+
+    return ret, errors
+
+
+def validate_shard(description, items, max_errors=None, sparse=False, start=0):
+    """
+    Worker entry point of `ListSerializer.is_valid_in_executor()`.
+    Rebuilds the child serializer from its picklable description and
+    validates one shard of items.
+    """
+    serializer_class, kwargs = description
+    return validate_items(
+        serializer_class(**kwargs), items, max_errors, sparse, start)
+
+
+def has_errors(errors):
+    """
+    Whether the list or sparse errors of a list of items hold any error.
+    """
+    if isinstance(errors, list):
+        return any(errors)
+    return bool(errors)
+
+
+def limit_errors(errors, max_errors):
+    """
+    Truncate the list or sparse errors of a list of items after
+    `max_errors` invalid items.
+    """
+    if max_errors is None:
+        return errors
+    if not isinstance(errors, list):
+        return OrderedDict(list(errors.items())[:max_errors])
+    error_count = 0
+    for index, detail in enumerate(errors):
+        if detail:
+            error_count += 1
+            if error_count >= max_errors:
+                return errors[:index + 1]
+    return errors
+
+
+def get_plan_attribute(instance, mapping, field, attr, getter, custom_getter):
+    """
+    Look up the value of one output plan entry on the given instance.
+    Returns `empty` if the field should be skipped for this instance.
+    """
+    if instance is None:
+        return None
+    try:
+        if attr is None:
+            return getter(instance)
+        if mapping:
+            attribute = instance[attr]
+        else:
+            attribute = getattr(instance, attr)
+        if type(attribute) in CALLABLE_TYPES:
+            attribute = call_attribute(attribute, attr)
+        return attribute
+    except SkipField:
+        return empty
+    except (KeyError, AttributeError) as exc:
+        if custom_getter:
+            raise
+        try:
+            field.attribute_error(instance, exc)
+        except SkipField:
+            return empty
+
+
+def get_requested_fieldset(context):
+    """
+    Return the `(fields, exclude)` trees requested for a root serializer,
+    either with the `fields` and `exclude` context keys or with the query
+    parameters of the request found in the context.
+    """
+    request = context.get('request')
+    query = getattr(request, 'query', None)
+    ret = []
+    for key, param in (('fields', api_settings.FIELDS_PARAM),
+                       ('exclude', api_settings.EXCLUDE_PARAM)):
+        value = context.get(key)
+        if value is None and query is not None:
+            value = query.getall(param, None)
+        if not value:
+            ret.append(())
+            continue
+        if not isinstance(value, str):
+            value = ','.join(value)
+        ret.append(parse_fieldset(value))
+    return tuple(ret)
+
+
 def as_serializer_error(exc):
     assert isinstance(exc, ValidationError)
 
@@ -277,6 +473,10 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
     default_error_messages = {
         'invalid': 'Invalid data. Expected a dictionary, but got {datatype}.'
     }
+    clone_exclude = BaseSerializer.clone_exclude + (
+        '_fields', '_writable_fields', '_readable_fields', '_compiled',
+        '_plan_template', '_representation_plan', '_plain_dicts', '_fieldset'
+    )
 
     @property
     def fields(self):
@@ -301,10 +501,69 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 
     @cached_property
     def _readable_fields(self):
-        return [
+        fields = [
             field for field in self.fields.values()
             if not field.write_only
         ]
+        selected, excluded = self._fieldset
+        if not (selected or excluded):
+            return fields
+
+        # Sparse fieldset, pruned before any attribute is accessed.
+        field_names = get_projection(
+            self.__class__, tuple(field.field_name for field in fields),
+            selected, excluded
+        )
+        return [self.fields[field_name] for field_name in field_names]
+
+    @cached_property
+    def _fieldset(self):
+        """
+        The `(fields, exclude)` trees that apply to this serializer.
+        Nested serializers use the dotted paths below their field name.
+        """
+        node, parent = self, self.parent
+        if isinstance(parent, ListSerializer):
+            node, parent = parent, parent.parent
+        if parent is None:
+            return get_requested_fieldset(self.context)
+        fieldset = getattr(parent, '_fieldset', None)
+        if fieldset is None:
+            return (), ()
+        return get_fieldset_subtree(fieldset[0], fieldset[1], node.field_name)
+
+    @cached_property
+    def _compiled(self):
+        meta = getattr(self, 'Meta', None)
+        return getattr(meta, 'compiled', api_settings.COMPILED_SERIALIZERS)
+
+    @cached_property
+    def _plain_dicts(self):
+        meta = getattr(self, 'Meta', None)
+        return getattr(meta, 'plain_dicts', api_settings.PLAIN_DICT_REPRESENTATION)
+
+    @property
+    def dict_class(self):
+        """
+        The mapping type used for the representation of a single object.
+        """
+        return dict if self._plain_dicts else OrderedDict
+
+    @property
+    def return_dict_class(self):
+        """
+        The mapping type returned by `.data` and `.errors`.
+        """
+        return ReturnPlainDict if self._plain_dicts else ReturnDict
+
+    @cached_property
+    def _plan_template(self):
+        return get_plan_template(self.__class__, self._readable_fields)
+
+    @cached_property
+    def _representation_plan(self):
+        return build_representation_plan(
+            self._plan_template, self._readable_fields)
 
     def get_fields(self):
         """
@@ -313,7 +572,13 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
         # Every new serializer is created with a clone of the field instances.
         # This allows users to dynamically modify the fields on a serializer
         # instance without affecting every other serializer class.
-        return copy.deepcopy(self._declared_fields)
+        # Clones share the configuration of the declared fields, so this is
+        # much cheaper than `copy.deepcopy()`, which re-runs `__init__()`
+        # for every field of the tree.
+        return OrderedDict(
+            (field_name, field.clone())
+            for field_name, field in self._declared_fields.items()
+        )
 
     def get_validators(self):
         """
@@ -366,6 +631,24 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 
         return value
 
+    async def run_validation_async(self, data=empty):
+        """
+        Async counterpart of `run_validation()`.
+        """
+        (is_empty_value, data) = self.validate_empty_values(data)
+        if is_empty_value:
+            return data
+
+        value = await self.to_internal_value_async(data)
+        try:
+            await self.run_validators_async(value)
+            value = await self.validate_async(value)
+            assert value is not None, '.validate() should return the validated data'
+        except ValidationError as exc:
+            raise ValidationError(detail=as_serializer_error(exc))
+
+        return value
+
     def to_internal_value(self, data):
         """
         Dict of native values <- Dict of primitive datatypes.
@@ -384,11 +667,22 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 
         for field in fields:
             validate_method = getattr(self, 'validate_' + field.field_name, None)
+            # Checked before the call, so that no coroutine is left unawaited.
+            assert not inspect.iscoroutinefunction(validate_method), (
+                '`validate_%s()` is a coroutine function. Use '
+                '`is_valid_async()` to validate the serializer.' %
+                field.field_name
+            )
             primitive_value = field.get_value(data)
             try:
                 validated_value = field.run_validation(primitive_value)
                 if validate_method is not None:
                     validated_value = validate_method(validated_value)
+                    assert not inspect.isawaitable(validated_value), (
+                        '`validate_%s()` returned an awaitable. Use '
+                        '`is_valid_async()` to validate the serializer.' %
+                        field.field_name
+                    )
             except ValidationError as exc:
                 message = exc.get_message()
                 if isinstance(message, (str, dict)):
@@ -404,11 +698,62 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 
         return ret
 
+    async def to_internal_value_async(self, data):
+        """
+        Async counterpart of `to_internal_value()`, validating all the
+        fields concurrently.
+        """
+        if not isinstance(data, Mapping):
+            message = self.error_messages['invalid'].format(
+                datatype=type(data).__name__
+            )
+            raise ValidationError(detail={
+                NON_FIELD_ERRORS_KEY: [message]
+            }, api_code='invalid')
+
+        ret = OrderedDict()
+        errors = OrderedDict()
+        fields = self._writable_fields
+
+        results = await asyncio.gather(*[
+            self._validate_field_async(field, data) for field in fields
+        ], return_exceptions=True)
+
+        for field, result in zip(fields, results):
+            if isinstance(result, ValidationError):
+                message = result.get_message()
+                if isinstance(message, (str, dict)):
+                    message = [message, ]
+                errors[field.field_name] = message
+            elif isinstance(result, SkipField):
+                pass
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                set_value(ret, field.source_attrs, result)
+
+        if errors:
+            raise ValidationError(detail=errors)
+
+        return ret
+
+    async def _validate_field_async(self, field, data):
+        validate_method = getattr(self, 'validate_' + field.field_name, None)
+        primitive_value = field.get_value(data)
+        validated_value = await field.run_validation_async(primitive_value)
+        if validate_method is not None:
+            validated_value = await self.call_async(
+                validate_method, validated_value)
+        return validated_value
+
     def to_representation(self, instance):
         """
         Object instance -> Dict of primitive datatypes.
         """
-        ret = OrderedDict()
+        if self._compiled and instance is not None:
+            return self.compiled_representation(instance)
+
+        ret = self.dict_class()
         fields = self._readable_fields
 
         for field in fields:
@@ -426,6 +771,73 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 
         return ret
 
+    def compiled_representation(self, instance):
+        """
+        Object instance -> Dict of primitive datatypes.
+
+        Same output as the default `to_representation()`, but driven by
+        the precompiled output plan. Enabled by `Meta.compiled = True` or
+        the `COMPILED_SERIALIZERS` setting.
+        """
+        ret = self.dict_class()
+        mapping = is_mapping_type(type(instance))
+
+        # The fields are used with the cached template as is, since
+        # binding a plan would cost more than a single object saves.
+        for field, (field_name, attr, getter, custom_getter, column_converter,
+                    identity_types) in zip(self._readable_fields,
+                                           self._plan_template):
+            if custom_getter:
+                getter = field.get_attribute
+            attribute = get_plan_attribute(
+                instance, mapping, field, attr, getter, custom_getter)
+            if attribute is empty:
+                continue
+
+            if attribute is None:
+                ret[field_name] = None
+            elif type(attribute) in identity_types:
+                ret[field_name] = attribute
+            else:
+                ret[field_name] = field.to_representation(attribute)
+
+        return ret
+
+    def to_representation_many(self, instances):
+        """
+        List of object instances -> List of dicts of primitive datatypes.
+
+        Columnar counterpart of `to_representation()`. The values of every
+        field are collected into a column and converted with a single
+        `to_representation_many()` call, then the rows are assembled.
+        """
+        instances = list(instances)
+        dict_class = self.dict_class
+        rows = [dict_class() for _ in instances]
+        mappings = [is_mapping_type(type(instance)) for instance in instances]
+
+        for (field_name, field, attr, getter, custom_getter,
+             convert, convert_many, identity_types) in self._representation_plan:
+            column = [
+                get_plan_attribute(
+                    instance, mapping, field, attr, getter, custom_getter)
+                for instance, mapping in zip(instances, mappings)
+            ]
+
+            values = [
+                value for value in column
+                if value is not None and value is not empty
+            ]
+            converted = iter(convert_many(values) if values else ())
+
+            for row, value in zip(rows, column):
+                if value is None:
+                    row[field_name] = None
+                elif value is not empty:
+                    row[field_name] = next(converted)
+
+        return rows
+
     def validate(self, attrs):
         return attrs
 
@@ -451,20 +863,28 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
     # Include a backlink to the serializer class on return objects.
     # Allows renderers such as HTMLFormRenderer to get the full field info.
 
+    # The wrappers are built once, and replace the underlying representation
+    # so that a single copy of the data is kept alive.
+
     @property
     def data(self):
-        ret = super(Serializer, self).data
-        return ReturnDict(ret, serializer=self)
+        if not hasattr(self, '_return_data'):
+            ret = super(Serializer, self).data
+            self._data = self._return_data = self.return_dict_class(
+                ret, serializer=self)
+        return self._return_data
 
     @property
     def errors(self):
-        ret = super(Serializer, self).errors
-        if isinstance(ret, list) and len(ret) == 1 and getattr(ret[0], 'code', None) == 'null':
-            # Edge case. Provide a more descriptive error than
-            # "this field may not be null", when no data is passed.
-            detail = {'detail': 'No data provided', 'code': 'null'}
-            ret = {NON_FIELD_ERRORS_KEY: [detail, ]}
-        return ReturnDict(ret, serializer=self)
+        if not hasattr(self, '_return_errors'):
+            ret = super(Serializer, self).errors
+            if isinstance(ret, list) and len(ret) == 1 and getattr(ret[0], 'code', None) == 'null':
+                # Edge case. Provide a more descriptive error than
+                # "this field may not be null", when no data is passed.
+                detail = {'detail': 'No data provided', 'code': 'null'}
+                ret = {NON_FIELD_ERRORS_KEY: [detail, ]}
+            self._return_errors = self.return_dict_class(ret, serializer=self)
+        return self._return_errors
 
 
 # There's some replication of `ListField` here,
@@ -478,15 +898,57 @@ class ListSerializer(BaseSerializer):
         'not_a_list': 'Expected a list of items but got type "{input_type}".',
         'empty': 'This list may not be empty.'
     }
+    clone_exclude = BaseSerializer.clone_exclude + (
+        '_batch', '_convert_many', '_max_errors', '_sparse_errors'
+    )
 
     def __init__(self, *args, **kwargs):
         self.child = kwargs.pop('child', copy.deepcopy(self.child))
         self.allow_empty = kwargs.pop('allow_empty', True)
+        self.batch = kwargs.pop('batch', None)
+        self.fail_fast = kwargs.pop('fail_fast', False)
+        self.max_errors = kwargs.pop('max_errors', None)
+        self.sparse_errors = kwargs.pop('sparse_errors', None)
+        assert self.max_errors is None or self.max_errors > 0, (
+            '`max_errors` must be a positive integer.'
+        )
         assert self.child is not None, '`child` is a required argument.'
         assert not inspect.isclass(self.child), '`child` has not been instantiated.'
         super(ListSerializer, self).__init__(*args, **kwargs)
         self.child.bind(field_name='', parent=self)
 
+    def clone(self):
+        serializer = super(ListSerializer, self).clone()
+        serializer.child = self.child.clone()
+        serializer.child.source = None
+        serializer.child.bind(field_name='', parent=serializer)
+        return serializer
+
+    @cached_property
+    def _batch(self):
+        if self.batch is not None:
+            return self.batch
+        meta = getattr(self.child, 'Meta', None)
+        return getattr(meta, 'batch', api_settings.BATCH_SERIALIZERS)
+
+    @cached_property
+    def _convert_many(self):
+        return get_column_converter(self.child)
+
+    @cached_property
+    def _max_errors(self):
+        if self.fail_fast:
+            return 1
+        if self.max_errors is not None:
+            return self.max_errors
+        return api_settings.LIST_VALIDATION_MAX_ERRORS
+
+    @cached_property
+    def _sparse_errors(self):
+        if self.sparse_errors is not None:
+            return self.sparse_errors
+        return api_settings.SPARSE_LIST_ERRORS
+
     def get_initial(self):
         if hasattr(self, 'initial_data'):
             return self.to_representation(self.initial_data)
@@ -526,40 +988,174 @@ class ListSerializer(BaseSerializer):
         """
         List of dicts of native values <- List of dicts of primitive datatypes.
         """
-        if html.is_html_input(data):
-            data = html.parse_html_list(data)
+        data = self._get_list(data)
 
-        if not isinstance(data, list):
-            message = self.error_messages['not_a_list'].format(
-                input_type=type(data).__name__
-            )
-            raise ValidationError(detail={
-                'not_field_errors': [message, ]
-            }, api_code='not_a_list')
+        ret, errors = validate_items(
+            self.child, data, self._max_errors, self._sparse_errors)
 
-        if not self.allow_empty and len(data) == 0:
-            message = self.error_messages['empty']
-            raise ValidationError(detail={
-                NON_FIELD_ERRORS_KEY: [message]
-            }, code='empty')
+        if has_errors(errors):
+            raise ValidationError(detail=errors)
 
-        ret = []
-        errors = []
+        return ret
 
-        for item in data:
-            try:
-                validated = self.child.run_validation(item)
-            except ValidationError as exc:
-                errors.append(exc.detail)
+    async def run_validation_in_executor(self, data, executor):
+        """
+        Counterpart of `run_validation()` that validates the items in
+        `executor`, see `is_valid_in_executor()`.
+        """
+        (is_empty_value, data) = self.validate_empty_values(data)
+        if is_empty_value:
+            return data
+
+        value = await self.to_internal_value_in_executor(data, executor)
+        try:
+            self.run_validators(value)
+            value = self.validate(value)
+            assert value is not None, '.validate() should return the validated data'
+        except ValidationError as exc:
+            raise ValidationError(detail=as_serializer_error(exc))
+
+        return value
+
+    async def to_internal_value_in_executor(self, data, executor):
+        """
+        Split the items in shards of `OFFLOAD_SHARD_SIZE` and validate them
+        in parallel in `executor`. Payloads shorter than
+        `OFFLOAD_VALIDATION_THRESHOLD` are validated in process.
+        """
+        data = self._get_list(data)
+
+        max_errors, sparse = self._max_errors, self._sparse_errors
+
+        if len(data) < api_settings.OFFLOAD_VALIDATION_THRESHOLD:
+            ret, errors = validate_items(self.child, data, max_errors, sparse)
+        else:
+            loop = asyncio.get_event_loop()
+            description = self.get_offload_description()
+            shard_size = api_settings.OFFLOAD_SHARD_SIZE
+            results = await asyncio.gather(*[
+                loop.run_in_executor(executor, validate_shard, description,
+                                     data[start:start + shard_size],
+                                     max_errors, sparse, start)
+                for start in range(0, len(data), shard_size)
+            ])
+            ret = []
+            errors = OrderedDict() if sparse else []
+            for shard_ret, shard_errors in results:
+                ret.extend(shard_ret)
+                if sparse:
+                    errors.update(shard_errors)
+                else:
+                    errors.extend(shard_errors)
+            # Every shard stops at `max_errors` on its own.
+            errors = limit_errors(errors, max_errors)
+
+        if has_errors(errors):
+            raise ValidationError(detail=errors)
+
+        return ret
+
+    def get_offload_description(self):
+        """
+        Return a picklable `(serializer_class, kwargs)` description used to
+        rebuild the child serializer in the worker processes.
+
+        The positional arguments, ie the instance, and the per-request
+        arguments are not sent, the shards give the data. Since the context
+        is not sent either, validation that depends on it should not be
+        offloaded.
+        """
+        kwargs = {
+            key: value for key, value in self.child._kwargs.items()
+            if key not in OFFLOAD_EXCLUDED_KWARGS
+        }
+        return self.child.__class__, kwargs
+
+    async def run_validation_async(self, data=empty):
+        """
+        Async counterpart of `run_validation()`.
+        """
+        (is_empty_value, data) = self.validate_empty_values(data)
+        if is_empty_value:
+            return data
+
+        value = await self.to_internal_value_async(data)
+        try:
+            await self.run_validators_async(value)
+            value = await self.validate_async(value)
+            assert value is not None, '.validate() should return the validated data'
+        except ValidationError as exc:
+            raise ValidationError(detail=as_serializer_error(exc))
+
+        return value
+
+    async def to_internal_value_async(self, data):
+        """
+        Async counterpart of `to_internal_value()`, validating all the
+        items concurrently.
+        """
+        data = self._get_list(data)
+        max_errors, sparse = self._max_errors, self._sparse_errors
+
+        if max_errors is None:
+            results = await asyncio.gather(*[
+                self.child.run_validation_async(item) for item in data
+            ], return_exceptions=True)
+        else:
+            results = await self._validate_until_max_errors(data, max_errors)
+
+        ret = []
+        errors = OrderedDict() if sparse else []
+
+        for index, result in enumerate(results):
+            if isinstance(result, asyncio.CancelledError):
+                # Only items pending after `max_errors` failures are
+                # cancelled, so the list is invalid anyway.
+                if not sparse:
+                    errors.append({})
+                continue
+            elif isinstance(result, ValidationError):
+                if sparse:
+                    errors[index] = result.detail
+                else:
+                    errors.append(result.detail)
+            elif isinstance(result, BaseException):
+                raise result
             else:
-                ret.append(validated)
-                errors.append({})
+                ret.append(result)
+                if not sparse:
+                    errors.append({})
 
-        if any(errors):
+        errors = limit_errors(errors, max_errors)
+        if has_errors(errors):
             raise ValidationError(detail=errors)
 
         return ret
 
+    async def _validate_until_max_errors(self, data, max_errors):
+        """
+        Validate the items concurrently, cancelling the pending ones once
+        `max_errors` items have failed. Returns the results in item order,
+        with a `CancelledError` for every cancelled item.
+        """
+        tasks = [
+            asyncio.ensure_future(self.child.run_validation_async(item))
+            for item in data
+        ]
+        error_count = 0
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    await future
+                except ValidationError:
+                    error_count += 1
+                    if error_count >= max_errors:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
     def to_representation(self, data):
         """
         List of object instances -> List of dicts of primitive datatypes.
@@ -568,10 +1164,33 @@ class ListSerializer(BaseSerializer):
         # so, first get a queryset from the Manager if needed
         iterable = data
 
+        if self._batch:
+            return self._convert_many(list(iterable))
+
         return [
             self.child.to_representation(item) for item in iterable
         ]
 
+    def _get_list(self, data):
+        if html.is_html_input(data):
+            data = html.parse_html_list(data)
+
+        if not isinstance(data, list):
+            message = self.error_messages['not_a_list'].format(
+                input_type=type(data).__name__
+            )
+            raise ValidationError(detail={
+                NON_FIELD_ERRORS_KEY: [message, ]
+            }, api_code='not_a_list')
+
+        if not self.allow_empty and len(data) == 0:
+            message = self.error_messages['empty']
+            raise ValidationError(detail={
+                NON_FIELD_ERRORS_KEY: [message]
+            }, api_code='empty')
+
+        return data
+
     def validate(self, attrs):
         return attrs
 
@@ -643,25 +1262,73 @@ class ListSerializer(BaseSerializer):
 
         return not bool(self._errors)
 
+    def get_empty_validated_data(self):
+        return []
+
+    async def is_valid_in_executor(self, executor, raise_exception=False):
+        """
+        Same as `is_valid()`, but large payloads are split in shards that
+        are validated in parallel in `executor`, usually a
+        `concurrent.futures.ProcessPoolExecutor`, so that validating them
+        does not block the event loop.
+
+        The child serializer class must be importable by the workers.
+        """
+        assert hasattr(self, 'initial_data'), (
+            'Cannot call `.is_valid_in_executor()` as no `data=` keyword '
+            'argument was passed when instantiating the serializer instance.'
+        )
+
+        if not hasattr(self, '_validated_data'):
+            try:
+                self._validated_data = await self.run_validation_in_executor(
+                    self.initial_data, executor)
+            except ValidationError as exc:
+                self._validated_data = []
+                self._errors = exc.detail
+            else:
+                self._errors = []
+
+        if self._errors and raise_exception:
+            raise ValidationError(detail=self.errors)
+
+        return not bool(self._errors)
+
+    def get_validation_concurrency(self):
+        meta = getattr(self.child, 'Meta', None)
+        return getattr(meta, 'async_concurrency',
+                       api_settings.ASYNC_VALIDATION_CONCURRENCY)
+
     def __repr__(self):
         return representation.list_repr(self, indent=1)
 
     # Include a backlink to the serializer class on return objects.
     # Allows renderers such as HTMLFormRenderer to get the full field info.
 
+    # The wrappers are built once, and replace the underlying representation
+    # so that a single copy of the data is kept alive.
+
     @property
     def data(self):
-        ret = super(ListSerializer, self).data
-        return ReturnList(ret, serializer=self)
+        if not hasattr(self, '_return_data'):
+            ret = super(ListSerializer, self).data
+            self._data = self._return_data = ReturnList(ret, serializer=self)
+        return self._return_data
 
     @property
     def errors(self):
-        ret = super(ListSerializer, self).errors
-        if isinstance(ret, list) and len(ret) == 1 and getattr(ret[0], 'code', None) == 'null':
-            # Edge case. Provide a more descriptive error than
-            # "this field may not be null", when no data is passed.
-            detail = {'detail': 'No data provided', 'code': 'null'}
-            ret = {NON_FIELD_ERRORS_KEY: [detail, ]}
-        if isinstance(ret, dict):
-            return ReturnDict(ret, serializer=self)
-        return ReturnList(ret, serializer=self)
+        if not hasattr(self, '_return_errors'):
+            ret = super(ListSerializer, self).errors
+            if isinstance(ret, list) and len(ret) == 1 and getattr(ret[0], 'code', None) == 'null':
+                # Edge case. Provide a more descriptive error than
+                # "this field may not be null", when no data is passed.
+                detail = {'detail': 'No data provided', 'code': 'null'}
+                ret = {NON_FIELD_ERRORS_KEY: [detail, ]}
+            if isinstance(ret, dict):
+                return_dict_class = getattr(
+                    self.child, 'return_dict_class', ReturnDict)
+                ret = return_dict_class(ret, serializer=self)
+            else:
+                ret = ReturnList(ret, serializer=self)
+            self._return_errors = ret
+        return self._return_errors
@@ -25,29 +25,31 @@ from aiorestframework import ISO_8601
 DEFAULTS = {
     # Base API policies
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        'aiorestframework.renderers.UJSONRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
-        'rest_framework.parsers.JSONParser',
-        'rest_framework.parsers.FormParser',
-        'rest_framework.parsers.MultiPartParser'
+        'aiorestframework.parsers.JSONParser',
+        'aiorestframework.parsers.FormParser',
+        'aiorestframework.parsers.MultiPartParser'
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication'
     ),
     'ENABLE_PERMISSIONS_CHECK': True,
+    'CONCURRENT_PERMISSIONS': False,
+    'PERMISSION_CACHE_TTL': 30,
+    'PERMISSION_CACHE_MAX_SIZE': 10000,
     'DEFAULT_PERMISSION_CLASSES': (
         'aiorestframework.permissions.AllowAny',
     ),
     'DEFAULT_THROTTLE_CLASSES': (),
-    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'rest_framework.negotiation.DefaultContentNegotiation',
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'aiorestframework.negotiation.DefaultContentNegotiation',
     'DEFAULT_METADATA_CLASS': 'rest_framework.metadata.SimpleMetadata',
     'DEFAULT_VERSIONING_CLASS': None,
 
     # Generic view behavior
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'aiorestframework.pagination.PageNumberPagination',
     'DEFAULT_FILTER_BACKENDS': (),
 
     # Throttling
@@ -59,6 +61,7 @@ DEFAULTS = {
 
     # Pagination
     'PAGE_SIZE': None,
+    'CURSOR_SECRET_KEY': None,
 
     # Filtering
     'SEARCH_PARAM': 'search',
@@ -107,6 +110,48 @@ DEFAULTS = {
     'TIME_FORMAT': ISO_8601,
     'TIME_INPUT_FORMATS': (ISO_8601,),
 
+    # Serialization
+    'COMPILED_SERIALIZERS': False,
+    'BATCH_SERIALIZERS': False,
+    'PLAIN_DICT_REPRESENTATION': False,
+    'FIELDS_PARAM': 'fields',
+    'EXCLUDE_PARAM': 'exclude',
+    'ASYNC_VALIDATION_CONCURRENCY': 10,
+    'OFFLOAD_VALIDATION_THRESHOLD': 10000,
+    'OFFLOAD_SHARD_SIZE': 5000,
+    'LIST_VALIDATION_MAX_ERRORS': None,
+    'SPARSE_LIST_ERRORS': False,
+
+    # Parsing, None disables a limit
+    'PARSER_MAX_BYTES': None,
+    'JSON_MAX_DEPTH': 64,
+    'JSON_MAX_ITEMS': 1000000,
+
+    # Conditional requests
+    'USE_ETAGS': True,
+
+    # Compression
+    'COMPRESSION_ENABLED': False,
+    'COMPRESSION_ENCODINGS': ('br', 'gzip', 'deflate'),
+    'COMPRESSION_LEVEL': 6,
+    'COMPRESSION_MIN_SIZE': 1024,
+    'COMPRESSION_EXECUTOR_THRESHOLD': 256 * 1024,
+
+    # Rendering, None disables the executor
+    'RENDER_EXECUTOR_THRESHOLD': 1024 * 1024,
+    'RENDER_EXECUTOR': None,
+
+    # Routing
+    'TRIE_URL_RESOLVER': False,
+
+    # Response cache
+    'RESPONSE_CACHE_TTL': 60,
+    'RESPONSE_CACHE_MAX_SIZE': 1024,
+
+    # Streaming
+    'STREAM_CHUNK_SIZE': 1000,
+    'STREAM_FLUSH_SIZE': 16 * 1024,
+
     # Encoding
     'DEFAULT_CHARSET': 'utf-8',
     'UNICODE_JSON': True,
@@ -135,6 +180,7 @@ IMPORT_STRINGS = (
     'DEFAULT_PERMISSION_CLASSES',
     'DEFAULT_THROTTLE_CLASSES',
     'DEFAULT_CONTENT_NEGOTIATION_CLASS',
+    'RENDER_EXECUTOR',
     'DEFAULT_METADATA_CLASS',
     'DEFAULT_VERSIONING_CLASS',
     'DEFAULT_PAGINATION_CLASS',
@@ -0,0 +1,94 @@
+"""
+MessagePack encoding of the types without a native MessagePack
+counterpart.
+
+Datetimes are sent as the standard timestamp extension type, UUIDs as
+16 bytes binaries and decimals as the `EXT_DECIMAL` extension type, which
+payload is the packed `[exponent, coefficient]` pair, or the ASCII string
+for the values that don't fit in it.
+"""
+import calendar
+import datetime
+import decimal
+import uuid
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from aiorestframework.utils import timezone
+
+
+__all__ = ('EXT_DECIMAL', 'pack_default', 'unpack_ext')
+
+
+EXT_DECIMAL = 1
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def pack_decimal(value):
+    sign, digits, exponent = value.as_tuple()
+    if isinstance(exponent, int) and digits:
+        coefficient = int(''.join(map(str, digits)))
+        # The sign of zero is kept by the string form only.
+        if coefficient or not sign:
+            if sign:
+                coefficient = -coefficient
+            if INT64_MIN <= coefficient <= INT64_MAX:
+                return msgpack.packb((exponent, coefficient))
+    return str(value).encode('ascii')
+
+
+def unpack_decimal(data):
+    """
+    Decode an `EXT_DECIMAL` payload. Malformed payloads raise `ValueError`,
+    like the other MessagePack decoding errors.
+    """
+    try:
+        if data[:1] == b'\x92':
+            # A fixarray of two items, strings never start with this byte.
+            exponent, coefficient = msgpack.unpackb(data)
+            digits = tuple(map(int, str(abs(coefficient))))
+            return decimal.Decimal((coefficient < 0, digits, exponent))
+        return decimal.Decimal(data.decode('ascii'))
+    except (decimal.InvalidOperation, TypeError) as exc:
+        raise ValueError('Invalid decimal: %s' % exc)
+
+
+def pack_datetime(value):
+    if timezone.is_naive(value):
+        value = value.replace(tzinfo=timezone.utc)
+    seconds = calendar.timegm(value.utctimetuple())
+    return msgpack.Timestamp(seconds, value.microsecond * 1000)
+
+
+def pack_default(obj):
+    """
+    Fallback for the types that MessagePack can't serialize natively.
+    """
+    if isinstance(obj, datetime.datetime):
+        return pack_datetime(obj)
+    elif isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    elif isinstance(obj, datetime.timedelta):
+        return obj.total_seconds()
+    elif isinstance(obj, decimal.Decimal):
+        return msgpack.ExtType(EXT_DECIMAL, pack_decimal(obj))
+    elif isinstance(obj, uuid.UUID):
+        return obj.bytes
+    elif isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError('Object of type %s is not MessagePack serializable.' %
+                    type(obj).__name__)
+
+
+def unpack_ext(code, data):
+    """
+    Decode the extension types packed by `pack_default()`.
+    """
+    if code == EXT_DECIMAL:
+        return unpack_decimal(data)
+    return msgpack.ExtType(code, data)
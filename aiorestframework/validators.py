@@ -1,3 +1,4 @@
+import asyncio
 import re
 from urllib.parse import urlsplit, urlunsplit
 
@@ -40,6 +41,48 @@ class BaseValidator:
                               api_code=self.api_code)
 
 
+class BaseAsyncValidator(BaseValidator):
+    """
+    Base class for validators that need to await I/O, such as existence or
+    uniqueness lookups. Async validators only run through
+    `serializer.is_valid_async()`.
+    """
+    is_async = True
+
+    async def __call__(self, value):
+        raise NotImplementedError('"validate" should be override.')
+
+
+def is_async_validator(validator):
+    """
+    True if the validator has to be awaited.
+    """
+    return getattr(validator, 'is_async', False) or \
+        asyncio.iscoroutinefunction(validator)
+
+
+class UniqueValidator(BaseAsyncValidator):
+    """
+    Fail if `await exists(value)` is true, eg:
+
+        async def email_exists(value):
+            return await db.fetchval(
+                'SELECT 1 FROM users WHERE email = $1', value) is not None
+
+        email = EmailField(validators=[UniqueValidator(email_exists)])
+    """
+    api_code = 'unique'
+    default_message = 'This field must be unique.'
+
+    def __init__(self, exists, **kwargs):
+        self.exists = exists
+        super().__init__(**kwargs)
+
+    async def __call__(self, value):
+        if await self.exists(value):
+            self.fail()
+
+
 class MaxValueValidator(BaseValidator):
     api_code = 'max_value'
     default_message = 'Ensure this value is less than or equal to {max_value}.'
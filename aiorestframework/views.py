@@ -1,5 +1,7 @@
 
 from .generics import GenericViewSet
+from .response import NDJSONStreamResponse
+from .settings import api_settings
 
 
 __all__ = (
@@ -30,9 +32,55 @@ class BaseViewSet(GenericViewSet):
 
 
 class ListMixin:
+    pagination_class = None
+
     async def list(self, request):
         raise NotImplementedError('"list" handler should be override.')
 
+    def get_paginator(self):
+        """
+        Return a new paginator, of `pagination_class` or else of the
+        `DEFAULT_PAGINATION_CLASS` setting.
+        """
+        pagination_class = self.pagination_class
+        if pagination_class is None:
+            pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
+        return pagination_class()
+
+    async def paginate_list(self, request, fetch, serializer_class,
+                            count=None):
+        """
+        Return a response with the page of rows requested.
+
+        :param request: Current request, passed in serializer context.
+        :param fetch: Coroutine function returning the rows of a
+         `pagination.PageQuery`.
+        :param serializer_class: Serializer class of one row.
+        :param count: Optional coroutine function returning the total
+         number of rows.
+        :return: Paginated Response instance.
+        """
+        paginator = self.get_paginator()
+        rows = await paginator.paginate(request, fetch, count)
+        serializer = serializer_class(
+            rows, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data)
+
+    def stream_list(self, request, items, serializer_class, **kwargs):
+        """
+        Return a response streaming `items`, an iterable or async iterator
+        of instances, as newline-delimited JSON.
+
+        :param request: Current request, passed in serializer context.
+        :param items: Instances to serialize.
+        :param serializer_class: Serializer class of one item.
+        :param kwargs: Extra `NDJSONStreamResponse` arguments.
+        :return: NDJSONStreamResponse instance.
+        """
+        serializer = serializer_class(
+            items, many=True, context={'request': request})
+        return NDJSONStreamResponse(serializer, **kwargs)
+
 
 class CreateMixin:
     async def create(self, request):
@@ -0,0 +1,120 @@
+"""
+Benchmark of request resolution with many registered ViewSets, with the
+stock aiohttp resolver and with the trie resolver of `APIUrlDispatcher`.
+The linear column is a scan of every resource in registration order, as
+done by the aiohttp versions without a resource index.
+
+    python benchmarks/resolver.py [--requests N] [--counts 10,100,1000]
+"""
+import argparse
+import asyncio
+import time
+
+from aiohttp.test_utils import make_mocked_request
+
+from aiorestframework.app import APIApplication
+from aiorestframework.routers import APIUrlDispatcher
+from aiorestframework.views import BaseViewSet
+
+
+class BenchViewSet(BaseViewSet):
+    bindings_update = {
+        'custom': {
+            'list': {'search': 'get'},
+            'detail': {'history': 'get'},
+        }
+    }
+
+    async def list(self, request):
+        pass
+
+    async def retrieve(self, request):
+        pass
+
+    async def search(self, request):
+        pass
+
+    async def history(self, request):
+        pass
+
+
+def build_router(count, use_trie):
+    router = APIUrlDispatcher(use_trie=use_trie)
+    APIApplication(router=router)
+    for index in range(count):
+        viewset = type('ViewSet%d' % index, (BenchViewSet,), {
+            'name': 'resource%d' % index})
+        router.register_viewset('/resource-%d' % index, viewset())
+    return router
+
+
+def build_requests(count):
+    # Spread over the registered ViewSets, the last one included.
+    indexes = sorted({0, count // 2, count - 1})
+    paths = []
+    for index in indexes:
+        paths.extend((
+            '/resource-%d' % index,
+            '/resource-%d/42' % index,
+            '/resource-%d/search' % index,
+            '/resource-%d/42/history' % index,
+        ))
+    paths.append('/missing/42')
+    return [make_mocked_request('GET', path) for path in paths]
+
+
+def describe(match_info):
+    resource = match_info.route.resource
+    status = getattr(match_info.http_exception, 'status', None)
+    return (getattr(resource, 'name', None), match_info.route.method,
+            dict(match_info), status)
+
+
+async def resolve_linear(router, request):
+    allowed_methods = set()
+    for resource in router.resources():
+        match_dict, allowed = await resource.resolve(request)
+        if match_dict is not None:
+            return match_dict
+        allowed_methods |= allowed
+
+
+async def measure(resolve, requests, total):
+    rounds = max(total // len(requests), 1)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for request in requests:
+            await resolve(request)
+    return (time.perf_counter() - started) / (rounds * len(requests))
+
+
+async def main(counts, total):
+    print('%10s %10s %12s %12s %12s' % (
+        'viewsets', 'resources', 'linear (us)', 'stock (us)', 'trie (us)'))
+    for count in counts:
+        stock = build_router(count, use_trie=False)
+        trie = build_router(count, use_trie=True)
+        requests = build_requests(count)
+        for request in requests:
+            # Both resolvers must agree.
+            expected = await stock.resolve(request)
+            resolved = await trie.resolve(request)
+            assert describe(expected) == describe(resolved), request.path
+        linear_time = await measure(
+            lambda request: resolve_linear(stock, request), requests,
+            # The linear scan is slow with many resources.
+            max(total * 100 // count, 100))
+        stock_time = await measure(stock.resolve, requests, total)
+        trie_time = await measure(trie.resolve, requests, total)
+        print('%10d %10d %12.2f %12.2f %12.2f' % (
+            count, len(stock.resources()), linear_time * 1e6,
+            stock_time * 1e6, trie_time * 1e6))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--counts', default='10,100,1000,3000')
+    args = parser.parse_args()
+    counts = [int(count) for count in args.counts.split(',')]
+    asyncio.get_event_loop().run_until_complete(main(counts, args.requests))
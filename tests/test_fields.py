@@ -0,0 +1,41 @@
+from aiorestframework import serializers
+
+
+class TestFieldClone:
+    class KindSerializer(serializers.Serializer):
+        kind = serializers.ChoiceField(choices=['a', 'b'])
+        group = serializers.ChoiceField(choices=[('Letters', ['a', 'b'])])
+        tags = serializers.ListField(child=serializers.CharField())
+
+    def test_error_messages_are_not_shared(self):
+        serializer = self.KindSerializer()
+        serializer.fields['kind'].error_messages['invalid_choice'] = 'X'
+
+        declared = self.KindSerializer._declared_fields['kind']
+        assert declared.error_messages['invalid_choice'] != 'X'
+        fresh = self.KindSerializer().fields['kind']
+        assert fresh.error_messages['invalid_choice'] != 'X'
+
+    def test_choices_are_not_shared(self):
+        serializer = self.KindSerializer()
+        field = serializer.fields['kind']
+        field.choices['c'] = 'c'
+        field.choice_strings_to_values['c'] = 'c'
+
+        fresh = self.KindSerializer().fields['kind']
+        assert 'c' not in fresh.choices
+        assert 'c' not in fresh.choice_strings_to_values
+
+    def test_grouped_choices_are_not_shared(self):
+        serializer = self.KindSerializer()
+        serializer.fields['group'].grouped_choices['Letters']['c'] = 'c'
+
+        fresh = self.KindSerializer().fields['group']
+        assert 'c' not in fresh.grouped_choices['Letters']
+
+    def test_child_error_messages_are_not_shared(self):
+        serializer = self.KindSerializer()
+        serializer.fields['tags'].child.error_messages['blank'] = 'X'
+
+        fresh = self.KindSerializer().fields['tags']
+        assert fresh.child.error_messages['blank'] != 'X'
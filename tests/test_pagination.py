@@ -0,0 +1,22 @@
+import warnings
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from aiorestframework.pagination import CursorPagination
+from aiorestframework.settings import api_settings
+
+
+class TestCursorSecretKey:
+    def test_warns_without_secret_key(self, monkeypatch):
+        monkeypatch.setattr(api_settings, 'CURSOR_SECRET_KEY', None)
+        with pytest.warns(RuntimeWarning, match='CURSOR_SECRET_KEY'):
+            CursorPagination().encode_cursor(False, (1,))
+
+    def test_cursor_round_trip_with_secret_key(self, monkeypatch):
+        monkeypatch.setattr(api_settings, 'CURSOR_SECRET_KEY', 'secret')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            cursor = CursorPagination().encode_cursor(False, (1,))
+            request = make_mocked_request('GET', '/?cursor=' + cursor)
+            assert CursorPagination().decode_cursor(request) == (False, (1,))
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from aiorestframework import exceptions
+from aiorestframework.parsers import (
+    JSONParser, LazyRequestData, check_json_limits
+)
+
+
+class TestCheckJSONLimits:
+    def test_mixed_nesting_over_max_depth(self):
+        body = b'[{"a":[{"b":[]}]}]'
+        with pytest.raises(exceptions.ParseError):
+            check_json_limits(body, max_depth=3)
+        with pytest.raises(exceptions.ParseError):
+            check_json_limits(body, max_depth=4)
+
+    def test_mixed_nesting_within_max_depth(self):
+        check_json_limits(b'[{"a":[{"b":[]}]}, {"c": [1, 2]}]', max_depth=5)
+
+    def test_brackets_in_strings_are_ignored(self):
+        check_json_limits(b'{"a": "[[[{{{", "b": "\\\\"}', max_depth=1)
+
+    def test_max_items(self):
+        with pytest.raises(exceptions.RequestEntityTooLarge):
+            check_json_limits(b'[1, 2, 3, 4]', max_items=3)
+        check_json_limits(b'["1,2,3,4"]', max_items=2)
+
+
+class TestLazyRequestData:
+    def test_no_body(self):
+        request = make_mocked_request('GET', '/')
+        parsed_data = LazyRequestData(request, [JSONParser()])
+        assert dict(asyncio.run(parsed_data())) == {}
+
+    def test_data_set_by_middleware(self):
+        request = make_mocked_request('POST', '/')
+        request.data = {'from': 'middleware'}
+        parsed_data = LazyRequestData(request, [JSONParser()])
+        assert asyncio.run(parsed_data()) == {'from': 'middleware'}
@@ -0,0 +1,27 @@
+import ujson
+
+from aiorestframework.renderers import JSONRenderer, UJSONRenderer
+from aiorestframework.settings import api_settings
+
+
+DATA = {'name': 'Zoë', 'city': '東京', 'url': 'http://example.org/a'}
+
+
+class TestUJSONRenderer:
+    def test_same_output_as_ujson_dumps(self):
+        expected = ujson.dumps(DATA).encode('utf-8')
+        assert UJSONRenderer().render(DATA) == expected
+
+    def test_ensure_ascii_can_be_disabled(self):
+        class UnicodeRenderer(UJSONRenderer):
+            ensure_ascii = False
+
+        assert 'Zoë'.encode('utf-8') in UnicodeRenderer().render(DATA)
+
+
+class TestJSONRenderer:
+    def test_ensure_ascii_follows_unicode_json(self, monkeypatch):
+        monkeypatch.setattr(api_settings, 'UNICODE_JSON', False)
+        assert b'\\u00eb' in JSONRenderer().render(DATA)
+        monkeypatch.setattr(api_settings, 'UNICODE_JSON', True)
+        assert 'Zoë'.encode('utf-8') in JSONRenderer().render(DATA)
@@ -0,0 +1,43 @@
+import asyncio
+
+from aiohttp.test_utils import make_mocked_request
+
+from aiorestframework.routers import APIUrlDispatcher
+
+
+async def handler(request):
+    pass
+
+
+def resolve(router, path, method='GET'):
+    request = make_mocked_request(method, path)
+    return asyncio.run(router.resolve(request))
+
+
+def make_router(use_trie):
+    router = APIUrlDispatcher(use_trie=use_trie)
+    router.add_get('/users/me', handler)
+    router.add_get('/users/{id}', handler)
+    router.add_get('/users/{id}/posts', handler)
+    return router
+
+
+class TestTrieResolver:
+    def test_same_matches_as_default_resolver(self):
+        paths = ('/users/me', '/users/42', '/users/42/posts', '/users/a%2Fb',
+                 '/users/a%2Fb/posts', '/users/a%20b', '/users', '/missing')
+        for path in paths:
+            expected = resolve(make_router(False), path)
+            match_info = resolve(make_router(True), path)
+            assert dict(match_info) == dict(expected), path
+            assert match_info.route.resource is None or (
+                match_info.route.resource.canonical ==
+                expected.route.resource.canonical), path
+
+    def test_encoded_slash_in_identifier(self):
+        match_info = resolve(make_router(True), '/users/a%2Fb')
+        assert match_info == {'id': 'a/b'}
+
+    def test_method_not_allowed(self):
+        match_info = resolve(make_router(True), '/users/42', method='POST')
+        assert match_info.http_exception.status == 405
@@ -0,0 +1,116 @@
+import asyncio
+import gc
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aiorestframework import serializers
+from aiorestframework.serializers import NON_FIELD_ERRORS_KEY
+
+
+class Author:
+    name = 'Ann'
+
+
+class Post:
+    id = 1
+    title = 'Hello'
+    score = 1.5
+    author = Author()
+
+    def slug(self):
+        return 'hello'
+
+
+class PostSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    score = serializers.FloatField()
+    slug = serializers.CharField()
+    author_name = serializers.CharField(source='author.name')
+    upper = serializers.SerializerMethodField()
+
+    def get_upper(self, obj):
+        return obj.title.upper()
+
+
+class CompiledPostSerializer(PostSerializer):
+    class Meta:
+        compiled = True
+
+
+class TestCompiledRepresentation:
+    def test_same_output_as_default(self):
+        post = Post()
+        assert CompiledPostSerializer(post).data == PostSerializer(post).data
+
+    def test_same_output_for_many(self):
+        second = Post()
+        second.id = 2
+        second.title = 'Bye'
+        posts = [Post(), second]
+        expected = PostSerializer(posts, many=True).data
+        assert CompiledPostSerializer(posts, many=True).data == expected
+
+    def test_template_is_shared_by_instances(self):
+        first = CompiledPostSerializer(Post())
+        second = CompiledPostSerializer(Post())
+        assert first.data == second.data
+        assert first._plan_template is second._plan_template
+
+
+class ItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+
+
+class TestListSerializerInput:
+    def test_empty_list_not_allowed(self):
+        serializer = ItemSerializer(data=[], many=True, allow_empty=False)
+        assert not serializer.is_valid()
+        assert NON_FIELD_ERRORS_KEY in serializer.errors
+
+    def test_empty_list_not_allowed_async(self):
+        serializer = ItemSerializer(data=[], many=True, allow_empty=False)
+        assert not asyncio.run(serializer.is_valid_async())
+        assert NON_FIELD_ERRORS_KEY in serializer.errors
+
+    def test_empty_list_not_allowed_in_executor(self):
+        serializer = ItemSerializer(data=[], many=True, allow_empty=False)
+        with ThreadPoolExecutor(1) as executor:
+            assert not asyncio.run(serializer.is_valid_in_executor(executor))
+        assert NON_FIELD_ERRORS_KEY in serializer.errors
+
+    def test_empty_list_allowed(self):
+        serializer = ItemSerializer(data=[], many=True)
+        assert serializer.is_valid()
+        assert serializer.validated_data == []
+
+    def test_not_a_list(self):
+        serializer = ItemSerializer(data={'id': 1}, many=True)
+        assert not serializer.is_valid()
+        assert NON_FIELD_ERRORS_KEY in serializer.errors
+
+
+class AsyncValidateSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+
+    async def validate_id(self, value):
+        return value
+
+
+class TestAsyncFieldValidators:
+    def test_sync_validation_rejects_coroutine_function(self):
+        serializer = AsyncValidateSerializer(data={'id': 1})
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            with pytest.raises(AssertionError):
+                serializer.is_valid()
+            gc.collect()
+        # No coroutine was created and left unawaited.
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
+    def test_async_validation(self):
+        serializer = AsyncValidateSerializer(data={'id': 1})
+        assert asyncio.run(serializer.is_valid_async())
+        assert serializer.validated_data == {'id': 1}